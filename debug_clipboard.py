@@ -8,6 +8,7 @@ import hashlib
 import base64
 import tempfile
 import os
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 import pyperclip
@@ -18,6 +19,10 @@ from pieces_os_client.wrapper import PiecesClient
 from pieces_os_client.models.classification_specific_enum import ClassificationSpecificEnum
 from pieces_os_client.models.fragment_metadata import FragmentMetadata
 
+# Remember at most this many recent items for duplicate detection
+MAX_CACHE_SIZE = 100
+
+
 def main():
     print("=== Debug Clipboard Service Starting ===")
     
@@ -34,7 +39,7 @@ def main():
     pieces_dir.mkdir(exist_ok=True)
     print(f"+ Files will be saved to: {pieces_dir}")
     
-    processed_items = {}
+    processed_items = OrderedDict()
     
     print("+ Service ready! Copy text or take screenshots.")
     print("+ Press Ctrl+C to stop.")
@@ -59,13 +64,16 @@ def main():
                 content_hash = hashlib.md5(content.encode()).hexdigest()
                 if content_hash in processed_items:
                     last_time = processed_items[content_hash]
-                    time_diff = time.time() - last_time
+                    time_diff = time.monotonic() - last_time
                     if time_diff < 30:
                         print(f"  - Duplicate content detected (processed {time_diff:.1f}s ago)")
                         time.sleep(2)
                         continue
                 
-                processed_items[content_hash] = time.time()
+                processed_items[content_hash] = time.monotonic()
+                processed_items.move_to_end(content_hash)
+                if len(processed_items) > MAX_CACHE_SIZE:
+                    processed_items.popitem(last=False)
                 print(f"  - New content detected, processing...")
                 
                 # Determine content type
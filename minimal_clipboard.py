@@ -9,6 +9,7 @@ import hashlib
 import base64
 import tempfile
 import os
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 import pyperclip
@@ -19,6 +20,10 @@ from pieces_os_client.wrapper import PiecesClient
 from pieces_os_client.models.classification_specific_enum import ClassificationSpecificEnum
 from pieces_os_client.models.fragment_metadata import FragmentMetadata
 
+# Remember at most this many recent items for duplicate detection
+MAX_CACHE_SIZE = 100
+
+
 def main():
     print("Minimal Clipboard Service Starting...")
     
@@ -35,7 +40,7 @@ def main():
     pieces_dir.mkdir(exist_ok=True)
     print(f"Files saved to: {pieces_dir}")
     
-    processed_items = {}
+    processed_items = OrderedDict()
     
     print("Service ready! Copy text or take screenshots.")
     print("Press Ctrl+C to stop.")
@@ -53,11 +58,14 @@ def main():
                 # Check for duplicates
                 content_hash = hashlib.md5(content.encode()).hexdigest()
                 if content_hash in processed_items:
-                    if time.time() - processed_items[content_hash] < 30:
+                    if time.monotonic() - processed_items[content_hash] < 30:
                         time.sleep(2)
                         continue
                 
-                processed_items[content_hash] = time.time()
+                processed_items[content_hash] = time.monotonic()
+                processed_items.move_to_end(content_hash)
+                if len(processed_items) > MAX_CACHE_SIZE:
+                    processed_items.popitem(last=False)
                 
                 # Determine content type
                 if content.startswith('iVBORw0KGgo') or content.startswith('/9j/'):
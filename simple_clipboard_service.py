@@ -9,9 +9,9 @@ import os
 import hashlib
 import base64
 import tempfile
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-import pyperclip
 from PIL import Image
 import win32clipboard
 import win32con
@@ -22,9 +22,12 @@ from pieces_os_client.models.classification_specific_enum import ClassificationS
 from pieces_os_client.models.fragment_metadata import FragmentMetadata
 
 class SimpleClipboardService:
+    MAX_CACHE_SIZE = 100
+    
     def __init__(self):
         self.client = PiecesClient()
-        self.processed_items = {}
+        # Insertion-ordered so the oldest hash is evicted in O(1)
+        self.processed_items = OrderedDict()
         self.pieces_dir = Path.home() / ".clipboard-to-pieces"
         self.pieces_dir.mkdir(exist_ok=True)
         
@@ -33,30 +36,32 @@ class SimpleClipboardService:
     
     def detect_clipboard_content(self):
         """Detect clipboard content type"""
+        # Image first, then text, read in a single clipboard session
+        # (win32clipboard reads CF_UNICODETEXT directly, unlike pyperclip)
         try:
-            # Try Windows clipboard for images
+            for clipboard_format in (win32con.CF_DIB, win32con.CF_UNICODETEXT):
+                if win32clipboard.IsClipboardFormatAvailable(clipboard_format):
+                    break
+            else:
+                return None, None
+            
             win32clipboard.OpenClipboard()
-            if win32clipboard.IsClipboardFormatAvailable(win32con.CF_DIB):
-                image_data = win32clipboard.GetClipboardData(win32con.CF_DIB)
+            try:
+                content = win32clipboard.GetClipboardData(clipboard_format)
+            finally:
                 win32clipboard.CloseClipboard()
-                if image_data:
-                    return "image", image_data
-            win32clipboard.CloseClipboard()
         except:
-            pass
+            return None, None
         
-        # Try pyperclip for text
-        try:
-            content = pyperclip.paste()
-            if content:
-                # Check if it's base64 image
-                if (content.startswith('iVBORw0KGgo') or content.startswith('/9j/')):
-                    return "image", content
-                return "text", content
-        except:
-            pass
+        if not content:
+            return None, None
+        if clipboard_format == win32con.CF_DIB:
+            return "image", content
         
-        return None, None
+        # Check if it's base64 image
+        if (content.startswith('iVBORw0KGgo') or content.startswith('/9j/')):
+            return "image", content
+        return "text", content
     
     def process_text(self, text_content):
         """Process text content"""
@@ -87,15 +92,18 @@ class SimpleClipboardService:
     def process_image(self, image_content):
         """Process image content"""
         try:
+            # Decode once; the same bytes are written to the temp file,
+            # used for the base64 fallback, and saved locally
+            if isinstance(image_content, str):
+                # Base64 content
+                image_data = base64.b64decode(image_content)
+            else:
+                # Binary content
+                image_data = image_content
+            
             # Save image to temp file
             with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                if isinstance(image_content, str):
-                    # Base64 content
-                    image_data = base64.b64decode(image_content)
-                    tmp_file.write(image_data)
-                else:
-                    # Binary content
-                    tmp_file.write(image_content)
+                tmp_file.write(image_data)
                 temp_path = tmp_file.name
             
             # Try simple file upload approach
@@ -113,10 +121,7 @@ class SimpleClipboardService:
             except Exception as e:
                 print(f"File path method failed: {e}")
                 
-                # Fallback: read file and use base64
-                with open(temp_path, 'rb') as f:
-                    image_data = f.read()
-                
+                # Fallback: use base64
                 base64_data = base64.b64encode(image_data).decode('utf-8')
                 asset_id = self.client.create_asset(base64_data, metadata)
                 print(f"Image imported via base64: {asset_id}")
@@ -124,12 +129,8 @@ class SimpleClipboardService:
             # Save locally
             filename = f"Image_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.png"
             file_path = self.pieces_dir / filename
-            if isinstance(image_content, str):
-                with open(file_path, 'wb') as f:
-                    f.write(base64.b64decode(image_content))
-            else:
-                with open(file_path, 'wb') as f:
-                    f.write(image_content)
+            with open(file_path, 'wb') as f:
+                f.write(image_data)
             
             # Clean up temp file
             os.unlink(temp_path)
@@ -156,11 +157,14 @@ class SimpleClipboardService:
                 # Check for duplicates
                 content_hash = hashlib.md5(str(content).encode()).hexdigest()
                 if content_hash in self.processed_items:
-                    if time.time() - self.processed_items[content_hash] < 30:  # 30 seconds
+                    if time.monotonic() - self.processed_items[content_hash] < 30:  # 30 seconds
                         time.sleep(2)
                         continue
                 
-                self.processed_items[content_hash] = time.time()
+                self.processed_items[content_hash] = time.monotonic()
+                self.processed_items.move_to_end(content_hash)
+                while len(self.processed_items) > self.MAX_CACHE_SIZE:
+                    self.processed_items.popitem(last=False)
                 
                 print(f"Processing {content_type} content...")
                 
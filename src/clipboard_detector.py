@@ -1,24 +1,137 @@
 """
 Clipboard detection module for Windows clipboard monitoring.
-Handles both text and image content detection using pyperclip and win32clipboard.
+Handles both text and image content detection using win32clipboard.
 """
 
-import pyperclip
 import win32clipboard
 import win32con
+import win32gui
+import win32api
+import ctypes
 import logging
 import hashlib
+import threading
+import time
 from typing import Tuple, Optional, Union
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
 
+def _content_hash(data: Union[str, bytes]) -> str:
+    """Fast non-cryptographic hash of clipboard content for duplicate detection."""
+    if isinstance(data, str):
+        data = data.encode('utf-8', 'surrogatepass')
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ClipboardChangeListener:
+    """Signals clipboard changes using Windows clipboard format listener notifications."""
+    
+    WM_CLIPBOARDUPDATE = 0x031D
+    
+    def __init__(self, class_name: str = "ClipboardDetectorListener"):
+        self.class_name = class_name
+        self.changed = threading.Event()
+        self._hwnd = None
+    
+    def start(self) -> bool:
+        """
+        Create a message-only window registered with AddClipboardFormatListener.
+        
+        The window's message pump runs on a daemon thread and sets self.changed
+        on every WM_CLIPBOARDUPDATE.
+        
+        Returns:
+            True if the listener is running, False if notifications are unavailable
+        """
+        ready = threading.Event()
+        
+        def wnd_proc(hwnd, msg, wparam, lparam):
+            if msg == self.WM_CLIPBOARDUPDATE:
+                self.changed.set()
+                return 0
+            if msg == win32con.WM_CLOSE:
+                win32gui.DestroyWindow(hwnd)
+                return 0
+            if msg == win32con.WM_DESTROY:
+                ctypes.windll.user32.RemoveClipboardFormatListener(hwnd)
+                win32gui.PostQuitMessage(0)
+                return 0
+            return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
+        
+        def pump():
+            try:
+                wc = win32gui.WNDCLASS()
+                wc.lpfnWndProc = wnd_proc
+                wc.lpszClassName = self.class_name
+                wc.hInstance = win32api.GetModuleHandle(None)
+                win32gui.RegisterClass(wc)
+                hwnd = win32gui.CreateWindowEx(0, wc.lpszClassName, wc.lpszClassName, 0,
+                                               0, 0, 0, 0, win32con.HWND_MESSAGE, 0, wc.hInstance, None)
+                if not ctypes.windll.user32.AddClipboardFormatListener(hwnd):
+                    win32gui.DestroyWindow(hwnd)
+                    raise ctypes.WinError()
+                self._hwnd = hwnd
+            except Exception as e:
+                logger.warning(f"Clipboard change listener setup failed: {e}")
+                return
+            finally:
+                ready.set()
+            win32gui.PumpMessages()
+        
+        threading.Thread(target=pump, name="clipboard-listener", daemon=True).start()
+        ready.wait(timeout=5)
+        return self._hwnd is not None
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the clipboard changes or the timeout expires.
+        
+        Returns:
+            True if a change was signalled, False on timeout
+        """
+        if self.changed.wait(timeout):
+            self.changed.clear()
+            return True
+        return False
+    
+    def signal_later(self, delay: float) -> None:
+        """
+        Set self.changed after delay seconds, so a read that failed (the
+        clipboard is often still held by its owner right after
+        WM_CLIPBOARDUPDATE) is retried without waiting for the next change.
+        """
+        timer = threading.Timer(delay, self.changed.set)
+        timer.daemon = True
+        timer.start()
+    
+    def stop(self) -> None:
+        """Close the listener window, ending its message pump."""
+        if self._hwnd is not None:
+            try:
+                win32gui.PostMessage(self._hwnd, win32con.WM_CLOSE, 0, 0)
+            except Exception as e:
+                logger.debug(f"Failed to stop clipboard listener: {e}")
+            self._hwnd = None
+
+
 class ClipboardDetector:
     """Detects clipboard content changes and handles different content types."""
     
     def __init__(self):
         self.last_content_hash = None
         self.last_detection_time = 0
+        # Clipboard sequence number the last hash was computed for
+        self.last_sequence = None
+        # Whether the last detect_clipboard_content call failed to read the clipboard
+        self.read_failed = False
         
     def detect_clipboard_content(self) -> Tuple[Optional[str], Optional[Union[str, bytes]]]:
         """
@@ -29,33 +142,47 @@ class ClipboardDetector:
             - content_type: "text", "image", or None
             - content: string for text, bytes/string for image, or None
         """
+        self.read_failed = False
+        
+        # Windows bumps the sequence number on every clipboard change; while it
+        # is unchanged the content (and its hash) is too, so skip the read
+        try:
+            sequence = win32clipboard.GetClipboardSequenceNumber()
+        except Exception:
+            sequence = None
+        if (sequence is not None and sequence == self.last_sequence and
+                time.monotonic() - self.last_detection_time < 30):
+            return None, None
+        
+        # Images first, then text, read in a single clipboard session; a
+        # failed read (clipboard held by another process) leaves
+        # last_sequence alone so the content is read again on retry
+        try:
+            clipboard_format, content = self._read_clipboard()
+        except Exception as e:
+            logger.debug(f"Clipboard read failed: {e}")
+            self.read_failed = True
+            return None, None
+        
         try:
-            # Try Windows clipboard first for images
-            win32clipboard.OpenClipboard()
-            
             # Check for DIB (Device Independent Bitmap) format
-            if win32clipboard.IsClipboardFormatAvailable(win32con.CF_DIB):
-                image_data = win32clipboard.GetClipboardData(win32con.CF_DIB)
-                win32clipboard.CloseClipboard()
-                
+            if clipboard_format == win32con.CF_DIB:
                 # Create hash for duplicate detection
-                content_hash = hashlib.md5(image_data).hexdigest()
+                content_hash = _content_hash(content)
+                self.last_sequence = sequence
                 if self._is_duplicate(content_hash):
                     return None, None
                     
                 self.last_content_hash = content_hash
-                return "image", image_data
-            
-            win32clipboard.CloseClipboard()
+                return "image", content
             
-            # Fallback to pyperclip for text/base64
-            content = pyperclip.paste()
             if not content or not content.strip():
                 return None, None
                 
             # Check if content is base64 image data
             if content.startswith(('iVBORw0KGgo', '/9j/', 'data:image')):
-                content_hash = hashlib.md5(content.encode()).hexdigest()
+                content_hash = _content_hash(content)
+                self.last_sequence = sequence
                 if self._is_duplicate(content_hash):
                     return None, None
                     
@@ -63,7 +190,8 @@ class ClipboardDetector:
                 return "image", content
             
             # Regular text content
-            content_hash = hashlib.md5(content.encode()).hexdigest()
+            content_hash = _content_hash(content)
+            self.last_sequence = sequence
             if self._is_duplicate(content_hash):
                 return None, None
                 
@@ -72,24 +200,39 @@ class ClipboardDetector:
             
         except Exception as e:
             logger.error(f"Error detecting clipboard content: {e}")
-            try:
-                win32clipboard.CloseClipboard()
-            except:
-                pass
             return None, None
     
+    def _read_clipboard(self) -> Tuple[Optional[int], Optional[Union[str, bytes]]]:
+        """
+        Read image or text data with one OpenClipboard/CloseClipboard pair.
+        
+        Returns:
+            Tuple of (format, data): CF_DIB bytes if an image is present,
+            otherwise CF_UNICODETEXT text, or (None, None)
+        """
+        for clipboard_format in (win32con.CF_DIB, win32con.CF_UNICODETEXT):
+            if win32clipboard.IsClipboardFormatAvailable(clipboard_format):
+                break
+        else:
+            return None, None
+        
+        win32clipboard.OpenClipboard()
+        try:
+            return clipboard_format, win32clipboard.GetClipboardData(clipboard_format)
+        finally:
+            win32clipboard.CloseClipboard()
+    
     def _is_duplicate(self, content_hash: str) -> bool:
         """
         Check if content is a duplicate within the last 30 seconds.
         
         Args:
-            content_hash: MD5 hash of the content
+            content_hash: Hash of the content
             
         Returns:
             True if duplicate, False otherwise
         """
-        import time
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # If same content and within 30 seconds, consider duplicate
         if (self.last_content_hash == content_hash and 
@@ -107,7 +250,13 @@ class ClipboardDetector:
             Text content or None if no text available
         """
         try:
-            content = pyperclip.paste()
+            if not win32clipboard.IsClipboardFormatAvailable(win32con.CF_UNICODETEXT):
+                return None
+            win32clipboard.OpenClipboard()
+            try:
+                content = win32clipboard.GetClipboardData(win32con.CF_UNICODETEXT)
+            finally:
+                win32clipboard.CloseClipboard()
             return content if content and content.strip() else None
         except Exception as e:
             logger.error(f"Error getting clipboard text: {e}")
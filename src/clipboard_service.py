@@ -14,7 +14,7 @@ import threading
 import tempfile
 import msvcrt
 
-from clipboard_detector import ClipboardDetector
+from clipboard_detector import ClipboardDetector, ClipboardChangeListener
 from image_processor import ImageProcessor
 from pieces_client import PiecesUploader
 
@@ -24,12 +24,18 @@ logger = logging.getLogger(__name__)
 class ClipboardService:
     """Main clipboard monitoring service."""
     
+    # A clipboard read that fails while waiting on change notifications is
+    # retried this many times, backing off by this many seconds per attempt
+    READ_RETRIES = 5
+    READ_RETRY_DELAY = 0.1
+    
     def __init__(self, check_interval: int = 2, max_cache_size: int = 100):
         """
         Initialize clipboard service.
         
         Args:
-            check_interval: Seconds between clipboard checks
+            check_interval: Seconds between clipboard checks when change
+                notifications are unavailable
             max_cache_size: Maximum number of processed items to cache
         """
         self.check_interval = check_interval
@@ -95,13 +101,41 @@ class ClipboardService:
         self.running = True
         logger.info("Clipboard service started")
         
+        # Wake on WM_CLIPBOARDUPDATE instead of polling; fall back to polling
+        # every check_interval seconds if the listener cannot be registered
+        listener = ClipboardChangeListener()
+        use_notifications = listener.start()
+        if use_notifications:
+            logger.info("Clipboard change notifications enabled")
+            listener.changed.set()  # pick up whatever is already on the clipboard
+        else:
+            logger.info(f"Polling clipboard every {self.check_interval}s")
+        
+        retries = 0
         try:
             while self.running:
-                self._check_clipboard()
-                time.sleep(self.check_interval)
+                if use_notifications:
+                    # The timeout only bounds how long stop() takes to be noticed
+                    if not listener.wait(timeout=1):
+                        continue
+                    self._check_clipboard()
+                    
+                    # There is no next poll to retry a busy clipboard, so
+                    # re-arm the notification after a short backoff
+                    if self.detector.read_failed and retries < self.READ_RETRIES:
+                        retries += 1
+                        listener.signal_later(self.READ_RETRY_DELAY * retries)
+                    else:
+                        if self.detector.read_failed:
+                            logger.warning("Clipboard stayed busy, giving up on the current content")
+                        retries = 0
+                else:
+                    self._check_clipboard()
+                    time.sleep(self.check_interval)
         except KeyboardInterrupt:
             logger.info("Service interrupted by user")
         finally:
+            listener.stop()
             self.stop()
     
     def stop(self) -> None:
@@ -10,6 +10,8 @@ from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+_LOG_LEVEL_RE = re.compile(r'\[(ERROR|WARN|INFO|DEBUG|TRACE)\]', re.IGNORECASE)
+
 class ContentType(Enum):
     CODE = "code"
     IMAGE = "image"
@@ -66,6 +68,24 @@ class ContextAnalyzer:
             r'^\s*\d+\.\d+',
             r'^\s*[A-Z_]{3,}',
         ]
+        
+        # One compiled alternation per category: a line counts once if any of
+        # its patterns matches at the start, which one match() call decides
+        self._line_res = {
+            ContentType.CODE: self._compile_union(self.code_patterns),
+            ContentType.CONFIG: self._compile_union(self.config_patterns),
+            ContentType.LOG: self._compile_union(self.log_patterns),
+            ContentType.DATA: self._compile_union(self.data_patterns),
+        }
+    
+    @staticmethod
+    def _compile_union(patterns: List[str]) -> re.Pattern:
+        return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+    
+    def _count_matching_lines(self, lines: List[str], content_type: ContentType) -> int:
+        """Number of lines matching any pattern of the given category"""
+        match = self._line_res[content_type].match
+        return sum(1 for line in lines if match(line))
 
     def analyze_content(self, content: str, content_type: str = None) -> ContentContext:
         """Analyze content and determine processing strategy"""
@@ -100,33 +120,19 @@ class ContextAnalyzer:
         
         # Use hint if provided
         if hint:
-            if 'image' in hint.lower():
+            hint_lower = hint.lower()
+            if 'image' in hint_lower:
                 return ContentType.IMAGE
-            elif 'code' in hint.lower():
+            elif 'code' in hint_lower:
                 return ContentType.CODE
         
         # Analyze content patterns
-        lines = content.split('\n')[:10]  # Analyze first 10 lines
-        
-        # Check for code patterns
-        code_score = sum(1 for line in lines if any(re.match(pattern, line, re.IGNORECASE) for pattern in self.code_patterns))
-        if code_score >= 2:
-            return ContentType.CODE
-        
-        # Check for config patterns
-        config_score = sum(1 for line in lines if any(re.match(pattern, line, re.IGNORECASE) for pattern in self.config_patterns))
-        if config_score >= 2:
-            return ContentType.CONFIG
+        lines = content.split('\n', 10)[:10]  # Analyze first 10 lines
         
-        # Check for log patterns
-        log_score = sum(1 for line in lines if any(re.match(pattern, line, re.IGNORECASE) for pattern in self.log_patterns))
-        if log_score >= 2:
-            return ContentType.LOG
-        
-        # Check for data patterns
-        data_score = sum(1 for line in lines if any(re.match(pattern, line, re.IGNORECASE) for pattern in self.data_patterns))
-        if data_score >= 2:
-            return ContentType.DATA
+        # Check code, config, log and data patterns in that order
+        for category in (ContentType.CODE, ContentType.CONFIG, ContentType.LOG, ContentType.DATA):
+            if self._count_matching_lines(lines, category) >= 2:
+                return category
         
         # Default to text
         return ContentType.TEXT
@@ -150,20 +156,14 @@ class ContextAnalyzer:
     def _calculate_confidence(self, content_type: ContentType, content: str) -> float:
         """Calculate confidence in content type detection"""
         
-        lines = content.split('\n')[:10]
+        lines = content.split('\n', 10)[:10]
         total_lines = len(lines)
         
         if total_lines == 0:
             return 0.0
         
-        if content_type == ContentType.CODE:
-            matches = sum(1 for line in lines if any(re.match(pattern, line, re.IGNORECASE) for pattern in self.code_patterns))
-        elif content_type == ContentType.CONFIG:
-            matches = sum(1 for line in lines if any(re.match(pattern, line, re.IGNORECASE) for pattern in self.config_patterns))
-        elif content_type == ContentType.LOG:
-            matches = sum(1 for line in lines if any(re.match(pattern, line, re.IGNORECASE) for pattern in self.log_patterns))
-        elif content_type == ContentType.DATA:
-            matches = sum(1 for line in lines if any(re.match(pattern, line, re.IGNORECASE) for pattern in self.data_patterns))
+        if content_type in self._line_res:
+            matches = self._count_matching_lines(lines, content_type)
         else:
             matches = total_lines // 2  # Default confidence for text
         
@@ -221,7 +221,8 @@ class ContextAnalyzer:
         # Adjust based on content characteristics
         if len(content) > 1000:
             priority += 1
-        if any(keyword in content.lower() for keyword in ['error', 'exception', 'fail']):
+        content_lower = content.lower()
+        if any(keyword in content_lower for keyword in ['error', 'exception', 'fail']):
             priority += 2
         
         return min(priority, 10)
@@ -251,9 +252,10 @@ class ContextAnalyzer:
         """Extract log levels from content"""
         
         levels = []
-        for line in content.split('\n')[:20]:
-            if re.search(r'\[(ERROR|WARN|INFO|DEBUG|TRACE)\]', line, re.IGNORECASE):
-                level = re.search(r'\[(ERROR|WARN|INFO|DEBUG|TRACE)\]', line, re.IGNORECASE).group(1).lower()
+        for line in content.split('\n', 20)[:20]:
+            match = _LOG_LEVEL_RE.search(line)
+            if match:
+                level = match.group(1).lower()
                 if level not in levels:
                     levels.append(level)
         
@@ -6,7 +6,7 @@ Handles image compression, resizing, and format conversion for Pieces.app upload
 import os
 import tempfile
 import logging
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, BmpImagePlugin
 from typing import Optional, Tuple
 import io
 import base64
@@ -17,6 +17,10 @@ logger = logging.getLogger(__name__)
 class ImageProcessor:
     """Processes and compresses images for optimal upload to Pieces.app."""
     
+    # JPEG quality ladder and the rough bits-per-pixel each level needs on screenshots
+    JPEG_QUALITIES = (90, 85, 70, 50, 30)
+    JPEG_MIN_BPP = (3.0, 2.0, 1.5, 0.8, 0.0)
+    
     def __init__(self, max_size_bytes: int = 500000, max_dimensions: Tuple[int, int] = (1920, 1080)):
         """
         Initialize image processor.
@@ -75,6 +79,9 @@ class ImageProcessor:
         """
         Convert Windows DIB (Device Independent Bitmap) to PIL Image.
         
+        CF_DIB data is a BMP file without its 14-byte file header, which
+        Pillow's DIB plugin reads directly from memory.
+        
         Args:
             dib_data: Raw DIB data
             
@@ -82,54 +89,11 @@ class ImageProcessor:
             PIL Image or None if conversion failed
         """
         try:
-            # DIB format starts with BITMAPINFOHEADER
-            # We need to create a proper BMP file from DIB data
-            bmp_data = self._dib_to_bmp(dib_data)
-            if bmp_data:
-                return Image.open(io.BytesIO(bmp_data))
-            return None
+            return BmpImagePlugin.DibImageFile(io.BytesIO(dib_data))
         except Exception as e:
             logger.error(f"Error converting DIB to PIL Image: {e}")
             return None
     
-    def _dib_to_bmp(self, dib_data: bytes) -> Optional[bytes]:
-        """
-        Convert DIB data to BMP format.
-        
-        Args:
-            dib_data: Raw DIB data
-            
-        Returns:
-            BMP data as bytes or None if conversion failed
-        """
-        try:
-            # DIB to BMP conversion
-            # BMP header is 14 bytes, DIB header starts after that
-            if len(dib_data) < 14:
-                return None
-                
-            # Extract dimensions from BITMAPINFOHEADER
-            width = int.from_bytes(dib_data[4:8], 'little')
-            height = int.from_bytes(dib_data[8:12], 'little')
-            bits_per_pixel = int.from_bytes(dib_data[14:16], 'little')
-            
-            # Calculate row padding
-            row_size = ((width * bits_per_pixel + 31) // 32) * 4
-            image_size = row_size * abs(height)
-            
-            # Create BMP header
-            bmp_header = bytearray(14)
-            bmp_header[0:2] = b'BM'  # Signature
-            bmp_header[2:6] = (14 + len(dib_data)).to_bytes(4, 'little')  # File size
-            bmp_header[6:10] = b'\x00\x00\x00\x00'  # Reserved
-            bmp_header[10:14] = (14).to_bytes(4, 'little')  # Data offset
-            
-            return bytes(bmp_header) + dib_data
-            
-        except Exception as e:
-            logger.error(f"Error converting DIB to BMP: {e}")
-            return None
-    
     def _base64_to_pil_image(self, base64_data: str) -> Optional[Image.Image]:
         """
         Convert base64 image data to PIL Image.
@@ -177,7 +141,11 @@ class ImageProcessor:
             
             # Resize if too large
             if image.size[0] > self.max_dimensions[0] or image.size[1] > self.max_dimensions[1]:
-                image.thumbnail(self.max_dimensions, Image.Resampling.LANCZOS)
+                # BICUBIC is indistinguishable from LANCZOS after JPEG for mild
+                # downscales and much cheaper; keep LANCZOS for 2x and beyond
+                ratio = max(image.size[0] / self.max_dimensions[0], image.size[1] / self.max_dimensions[1])
+                resample = Image.Resampling.BICUBIC if ratio < 2.0 else Image.Resampling.LANCZOS
+                image.thumbnail(self.max_dimensions, resample)
                 logger.info(f"Image resized to: {image.size}")
             
             # Auto-orient based on EXIF data
@@ -189,6 +157,14 @@ class ImageProcessor:
             logger.error(f"Error compressing image: {e}")
             return None
     
+    def _initial_quality_index(self, size: Tuple[int, int]) -> int:
+        """Pick the first JPEG quality to try from the bits-per-pixel budget."""
+        bits_per_pixel = self.max_size_bytes * 8 / max(1, size[0] * size[1])
+        for index, min_bpp in enumerate(self.JPEG_MIN_BPP):
+            if bits_per_pixel >= min_bpp:
+                return index
+        return len(self.JPEG_QUALITIES) - 1
+    
     def save_image_with_quality(self, image: Image.Image, output_path: str) -> bool:
         """
         Save image with optimal quality to meet size requirements.
@@ -201,27 +177,37 @@ class ImageProcessor:
             True if saved successfully, False otherwise
         """
         try:
-            # Try different quality levels
-            for quality in [90, 85, 70, 50, 30]:
-                image.save(output_path, 'JPEG', quality=quality, optimize=True)
+            # Encode in memory, starting at the quality predicted to fit the
+            # size budget, and only step down if the estimate was too high
+            buffer = io.BytesIO()
+            for quality in self.JPEG_QUALITIES[self._initial_quality_index(image.size):]:
+                buffer.seek(0)
+                buffer.truncate()
+                image.save(buffer, 'JPEG', quality=quality, optimize=True)
                 
-                # Check if file size meets requirements
-                if os.path.getsize(output_path) <= self.max_size_bytes:
-                    logger.info(f"Image saved with quality {quality}, size: {os.path.getsize(output_path)} bytes")
+                # Check if encoded size meets requirements
+                if buffer.tell() <= self.max_size_bytes:
+                    with open(output_path, 'wb') as f:
+                        f.write(buffer.getbuffer())
+                    logger.info(f"Image saved with quality {quality}, size: {buffer.tell()} bytes")
                     return True
             
             # If still too large, resize further
             logger.warning("Image still too large after quality reduction, resizing further")
-            while os.path.getsize(output_path) > self.max_size_bytes:
+            while buffer.tell() > self.max_size_bytes:
                 new_size = (int(image.size[0] * 0.8), int(image.size[1] * 0.8))
                 image = image.resize(new_size, Image.Resampling.LANCZOS)
-                image.save(output_path, 'JPEG', quality=30, optimize=True)
+                buffer.seek(0)
+                buffer.truncate()
+                image.save(buffer, 'JPEG', quality=30, optimize=True)
                 
                 if image.size[0] < 100 or image.size[1] < 100:
                     logger.error("Image too small after compression")
                     return False
             
-            logger.info(f"Image saved after additional resizing, size: {os.path.getsize(output_path)} bytes")
+            with open(output_path, 'wb') as f:
+                f.write(buffer.getbuffer())
+            logger.info(f"Image saved after additional resizing, size: {buffer.tell()} bytes")
             return True
             
         except Exception as e:
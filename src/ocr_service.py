@@ -7,11 +7,17 @@ Supports Windows, macOS, and Linux with multiple OCR engines
 import os
 import sys
 import logging
-from typing import Optional, Tuple
+import math
+import threading
+from typing import Optional, Tuple, Union
 from pathlib import Path
-from PIL import Image
+from PIL import Image, ImageFilter, ImageOps
 import tempfile
 
+# Single-image OCR gains nothing from OpenMP threads and slows down from the
+# thread thrash, so limit Tesseract to one thread unless the user overrides it
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
 class OCRService:
     """OCR service for extracting text from images using Tesseract only
     
@@ -22,22 +28,42 @@ class OCRService:
     - Configurable: Multiple language support and custom settings
     """
     
+    # OCR preprocessing: Tesseract works best around 300 DPI
+    SCREEN_DPI = 96
+    OCR_TARGET_DPI = 300
+    OCR_MAX_PIXELS = 8_000_000
+    OCR_BORDER = 10
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.available_engines = []
         self.preferred_engine = None
+        
+        # Persistent in-process Tesseract API (tesserocr); loaded once and
+        # shared, so calls are serialized with a lock
+        self._tess_api = None
+        self._tess_lock = threading.Lock()
+        
         self._detect_available_engines()
     
     def _detect_available_engines(self):
         """Detect available OCR engines - Tesseract only for privacy"""
         self.available_engines = []
         
+        # Prefer the in-process tesserocr binding: the model stays loaded
+        # between screenshots instead of spawning tesseract.exe per image
+        if self._check_tesserocr():
+            self.available_engines.append("tesserocr")
+            self.preferred_engine = "tesserocr"
+            self.logger.info("Tesseract OCR engine detected and enabled (in-process via tesserocr)")
+        
         # Only use Tesseract for maximum privacy
         if self._check_tesseract():
             self.available_engines.append("tesseract")
-            self.preferred_engine = "tesseract"
+            if self.preferred_engine is None:
+                self.preferred_engine = "tesseract"
             self.logger.info("Tesseract OCR engine detected and enabled")
-        else:
+        elif not self.available_engines:
             self.logger.warning("Tesseract OCR not available - OCR functionality disabled")
             self.logger.info("Install Tesseract for OCR support:")
             if sys.platform == "win32":
@@ -51,6 +77,20 @@ class OCRService:
         self.logger.info(f"Preferred engine: {self.preferred_engine}")
     
     
+    def _check_tesserocr(self) -> bool:
+        """Check if tesserocr is available and create the persistent API"""
+        try:
+            from tesserocr import PyTessBaseAPI, PSM, OEM
+            
+            # Same settings as the pytesseract path: --psm 6 --oem 3
+            self._tess_api = PyTessBaseAPI(lang='eng', psm=PSM.SINGLE_BLOCK, oem=OEM.DEFAULT)
+            self._tess_api.SetVariable('preserve_interword_spaces', '1')
+            return True
+            
+        except (ImportError, Exception):
+            self._tess_api = None
+            return False
+    
     def _check_tesseract(self) -> bool:
         """Check if Tesseract is available"""
         try:
@@ -69,12 +109,12 @@ class OCRService:
         except (ImportError, Exception):
             return False
     
-    def extract_text(self, image_path: str, engine: Optional[str] = None) -> Tuple[str, bool]:
+    def extract_text(self, image_path: Union[str, Image.Image], engine: Optional[str] = None) -> Tuple[str, bool]:
         """
         Extract text from image using OCR
         
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or an already-loaded PIL image
             engine: OCR engine to use (optional, uses preferred if not specified)
             
         Returns:
@@ -92,7 +132,9 @@ class OCRService:
             engine = self.preferred_engine
         
         try:
-            if engine == "tesseract":
+            if engine == "tesserocr":
+                return self._extract_text_tesserocr(image_path)
+            elif engine == "tesseract":
                 return self._extract_text_tesseract(image_path)
             else:
                 self.logger.error(f"Unknown OCR engine: {engine}")
@@ -102,12 +144,12 @@ class OCRService:
             self.logger.error(f"OCR extraction failed with {engine}: {e}")
             return "", False
     
-    def extract_text_with_boxes(self, image_path: str, engine: Optional[str] = None) -> Tuple[str, bool, list]:
+    def extract_text_with_boxes(self, image_path: Union[str, Image.Image], engine: Optional[str] = None) -> Tuple[str, bool, list]:
         """
         Extract text from image using OCR with bounding boxes
         
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or an already-loaded PIL image
             engine: OCR engine to use (optional, uses preferred if not specified)
             
         Returns:
@@ -125,7 +167,9 @@ class OCRService:
             engine = self.preferred_engine
         
         try:
-            if engine == "tesseract":
+            if engine == "tesserocr":
+                return self._extract_text_with_boxes_tesserocr(image_path)
+            elif engine == "tesseract":
                 return self._extract_text_with_boxes_tesseract(image_path)
             else:
                 self.logger.error(f"Unknown OCR engine: {engine}")
@@ -136,7 +180,124 @@ class OCRService:
             return "", False, []
     
     
-    def _extract_text_tesseract(self, image_path: str) -> Tuple[str, bool]:
+    def _open_image(self, image: Union[str, Image.Image]) -> Image.Image:
+        """Return a PIL image, opening it from disk if given a path"""
+        if isinstance(image, Image.Image):
+            return image
+        return Image.open(image)
+    
+    def _preprocess_for_ocr(self, image: Image.Image) -> Tuple[Image.Image, int]:
+        """
+        Prepare an image for Tesseract: grayscale, upscale towards 300 DPI,
+        edge-preserving denoise and a white border.
+        
+        Returns:
+            Tuple of (prepared_image, scale_factor)
+        """
+        image = image.convert('L')
+        
+        # Clipboard bitmaps usually carry no DPI; treat them as screen resolution
+        dpi = image.info.get('dpi', (self.SCREEN_DPI, self.SCREEN_DPI))[0] or self.SCREEN_DPI
+        scale = max(1, math.ceil(self.OCR_TARGET_DPI / dpi))
+        
+        # Don't upscale past the pixel budget - large screenshots are already legible
+        width, height = image.size
+        while scale > 1 and width * height * scale * scale > self.OCR_MAX_PIXELS:
+            scale -= 1
+        if scale > 1:
+            image = image.resize((width * scale, height * scale), Image.Resampling.LANCZOS)
+        
+        # Median filter removes speckle noise without blurring glyph edges
+        image = image.filter(ImageFilter.MedianFilter(3))
+        image = ImageOps.expand(image, border=self.OCR_BORDER, fill=255)
+        
+        return image, scale
+    
+    def _to_source_box(self, x: int, y: int, w: int, h: int, scale: int) -> Tuple[int, int, int, int]:
+        """Map a box from the preprocessed OCR image back to source image pixels"""
+        return (
+            max(0, (x - self.OCR_BORDER) // scale),
+            max(0, (y - self.OCR_BORDER) // scale),
+            -(-w // scale),
+            -(-h // scale)
+        )
+    
+    def _extract_text_tesserocr(self, image_path: Union[str, Image.Image]) -> Tuple[str, bool]:
+        """Extract text using the persistent in-process Tesseract API"""
+        try:
+            # Load image and prepare it for OCR
+            image, _ = self._preprocess_for_ocr(self._open_image(image_path))
+            
+            with self._tess_lock:
+                self._tess_api.SetImage(image)
+                text = self._tess_api.GetUTF8Text()
+            
+            # Clean up extracted text
+            cleaned_text = text.strip()
+            
+            if cleaned_text:
+                self.logger.debug(f"tesserocr extracted {len(cleaned_text)} characters")
+                return cleaned_text, True
+            else:
+                self.logger.debug("No text extracted by tesserocr")
+                return "", False
+            
+        except Exception as e:
+            self.logger.error(f"tesserocr OCR failed: {e}")
+            return "", False
+    
+    def _extract_text_with_boxes_tesserocr(self, image_path: Union[str, Image.Image]) -> Tuple[str, bool, list]:
+        """Extract text with word bounding boxes using the persistent in-process Tesseract API"""
+        try:
+            from tesserocr import RIL, iterate_level
+            
+            # Load image and prepare it for OCR (boxes are mapped back to source pixels)
+            image, scale = self._preprocess_for_ocr(self._open_image(image_path))
+            
+            words = []
+            bounding_boxes = []
+            
+            with self._tess_lock:
+                self._tess_api.SetImage(image)
+                self._tess_api.Recognize()
+                
+                for word in iterate_level(self._tess_api.GetIterator(), RIL.WORD):
+                    text = (word.GetUTF8Text(RIL.WORD) or "").strip()
+                    if not text:
+                        continue
+                    words.append(text)
+                    
+                    box = word.BoundingBox(RIL.WORD)
+                    if box is None:
+                        continue
+                    x1, y1, x2, y2 = box
+                    
+                    # Only include boxes with valid coordinates
+                    if x2 > x1 and y2 > y1:
+                        x, y, w, h = self._to_source_box(x1, y1, x2 - x1, y2 - y1, scale)
+                        bounding_boxes.append({
+                            'text': text,
+                            'x': x,
+                            'y': y,
+                            'width': w,
+                            'height': h,
+                            'confidence': word.Confidence(RIL.WORD)
+                        })
+            
+            cleaned_text = " ".join(words)
+            
+            if cleaned_text:
+                self.logger.debug(f"tesserocr extracted {len(cleaned_text)} characters with {len(bounding_boxes)} bounding boxes")
+                return cleaned_text, True, bounding_boxes
+            else:
+                self.logger.debug("No text extracted by tesserocr")
+                return "", False, []
+            
+        except Exception as e:
+            self.logger.error(f"tesserocr OCR with boxes failed: {e}")
+            return "", False, []
+    
+    def _extract_text_tesseract(self, image_path: Union[str, Image.Image]) -> Tuple[str, bool]:
         """Extract text using Tesseract with privacy-focused configuration"""
         try:
             import pytesseract
@@ -147,10 +308,8 @@ class OCRService:
             except:
                 pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
 
-            # Load image and convert to RGB format
-            image = Image.open(image_path)
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            # Load image and prepare it for OCR
+            image, _ = self._preprocess_for_ocr(self._open_image(image_path))
             
             # Privacy-focused OCR configuration
             # --psm 6: Assume a single uniform block of text
@@ -175,7 +334,7 @@ class OCRService:
             self.logger.error(f"Tesseract OCR failed: {e}")
             return "", False
     
-    def _extract_text_with_boxes_tesseract(self, image_path: str) -> Tuple[str, bool, list]:
+    def _extract_text_with_boxes_tesseract(self, image_path: Union[str, Image.Image]) -> Tuple[str, bool, list]:
         """Extract text using Tesseract with bounding boxes for redaction"""
         try:
             import pytesseract
@@ -186,10 +345,8 @@ class OCRService:
             except:
                 pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
             
-            # Load image and convert to RGB format
-            image = Image.open(image_path)
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            # Load image and prepare it for OCR (boxes are mapped back to source pixels)
+            image, scale = self._preprocess_for_ocr(self._open_image(image_path))
             
             # Privacy-focused OCR configuration
             config = '--psm 6 --oem 3 -c preserve_interword_spaces=1'
@@ -214,6 +371,7 @@ class OCRService:
                     
                     # Only include boxes with valid coordinates
                     if w > 0 and h > 0:
+                        x, y, w, h = self._to_source_box(x, y, w, h, scale)
                         bounding_boxes.append({
                             'text': text,
                             'x': x,
@@ -248,6 +406,16 @@ class OCRService:
     def get_preferred_engine(self) -> Optional[str]:
         """Get the preferred OCR engine"""
         return self.preferred_engine
+    
+    def close(self):
+        """Release the persistent Tesseract API, if one was created"""
+        with self._tess_lock:
+            if self._tess_api is not None:
+                self._tess_api.End()
+                self._tess_api = None
+        if "tesserocr" in self.available_engines:
+            self.available_engines.remove("tesserocr")
+            self.preferred_engine = self.available_engines[0] if self.available_engines else None
 
 # Global OCR service instance
 _ocr_service = None
@@ -33,6 +33,19 @@ class PiecesUploader:
         if not PIECES_AVAILABLE:
             logger.error("Pieces SDK not available")
             return
+        
+        # Metadata templates; uploads clone these with their own description
+        # instead of validating a fresh model each time
+        self._text_metadata_template = FragmentMetadata(
+            ext=ClassificationSpecificEnum.TXT,
+            tags=["clipboard", "auto-imported", "text"],
+            description=""
+        )
+        self._image_metadata_template = FragmentMetadata(
+            ext=ClassificationSpecificEnum.JPG,
+            tags=["clipboard", "auto-imported", "image"],
+            description=""
+        )
             
         self._initialize_client()
         self._ensure_backup_directory()
@@ -88,11 +101,9 @@ class PiecesUploader:
         
         try:
             # Create metadata
-            metadata = FragmentMetadata(
-                ext=ClassificationSpecificEnum.TXT,
-                tags=["clipboard", "auto-imported", "text"],
-                description=description or f"Text from clipboard: {datetime.now().isoformat()}"
-            )
+            metadata = self._text_metadata_template.model_copy(update={
+                "description": description or f"Text from clipboard: {datetime.now().isoformat()}"
+            })
             
             # Upload text content
             asset_id = self.client.create_asset(text_content, metadata)
@@ -120,11 +131,9 @@ class PiecesUploader:
         
         try:
             # Create metadata
-            metadata = FragmentMetadata(
-                ext=ClassificationSpecificEnum.JPG,
-                tags=["clipboard", "auto-imported", "image"],
-                description=description or f"Image from clipboard: {datetime.now().isoformat()}"
-            )
+            metadata = self._image_metadata_template.model_copy(update={
+                "description": description or f"Image from clipboard: {datetime.now().isoformat()}"
+            })
             
             # Upload image file
             asset_id = self.client.create_asset(image_path, metadata)
@@ -221,7 +230,7 @@ class PiecesUploader:
             
             # Copy image file
             import shutil
-            shutil.copy2(image_path, backup_path)
+            shutil.copyfile(image_path, backup_path)
             
             # Create description file
             desc_filename = f"image_backup_{timestamp}.txt"
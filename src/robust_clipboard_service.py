@@ -8,7 +8,6 @@ import time
 import os
 import json
 import base64
-import tempfile
 import shutil
 import logging
 import hashlib
@@ -16,20 +15,26 @@ import sys
 import msvcrt
 import importlib
 import threading
+import queue
+import signal
+import re
+from collections import OrderedDict, defaultdict
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-import pyperclip
-from PIL import Image
+from PIL import Image, BmpImagePlugin
 import io
 import win32clipboard
 import win32con
-from security_filter import SecurityFilter
+import security_filter as security_filter_module
 from ocr_service import get_ocr_service
 from context_analyzer import ContextAnalyzer, ContentContext
 from state_manager import StateManager, ProcessingState
+from clipboard_detector import ClipboardChangeListener
 from feedback_system import FeedbackSystem, FeedbackType, AdaptiveProcessor
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 from pieces_os_client.wrapper import PiecesClient
 from pieces_os_client.models.classification_specific_enum import ClassificationSpecificEnum
 from pieces_os_client.models.fragment_metadata import FragmentMetadata
@@ -39,6 +44,22 @@ from pieces_os_client.models.application_name_enum import ApplicationNameEnum
 from pieces_os_client.models.platform_enum import PlatformEnum
 from pieces_os_client.models.privacy_enum import PrivacyEnum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    from watchfiles import watch as watch_files, Change
+except ImportError:
+    watch_files = None
+    Change = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -49,65 +70,157 @@ logging.basicConfig(
     ]
 )
 
-class SecurityFilterReloader(FileSystemEventHandler):
+# Matches a 100-character run of the base64 alphabet (used to sniff unprefixed images)
+_B64_RE = re.compile(r'[A-Za-z0-9+/=]{100}')
+
+# First bytes of every PNG file
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Clipboard formats read by the service, in order of preference
+_CF_DIB = win32con.CF_DIB
+_CF_TEXT = win32con.CF_TEXT
+_READ_FORMATS = (_CF_DIB, win32con.CF_UNICODETEXT, _CF_TEXT)
+
+# (epoch second, ISO string) of the last timestamp formatted by _now_iso
+_iso_cache = (None, None)
+
+def _now_iso():
+    """Current local time as an ISO string at seconds resolution, formatted once per second"""
+    global _iso_cache
+    second = int(time.time())
+    cached_second, stamp = _iso_cache
+    if cached_second != second:
+        stamp = datetime.fromtimestamp(second).isoformat()
+        _iso_cache = (second, stamp)
+    return stamp
+
+class SecurityFilterReloader(PatternMatchingEventHandler):
     """File watcher for hot-reloading security filter changes
     
     This class monitors security_filter.py and security_config.json for changes
     and automatically reloads the security filter without restarting the service.
+    Watchdog's pattern matching drops events for other files before they reach
+    the handlers, and a short trailing timer collapses an editor or git burst
+    into a single reload.
     """
     
-    def __init__(self, service_instance):
+    WATCHED_PATTERNS = ['*security_filter.py', '*security_config.json']
+    RELOAD_EVENTS = frozenset(('modified', 'created', 'moved', 'closed'))
+    DEBOUNCE_SECONDS = 0.1
+    
+    def __init__(self, service_instance, watched_paths=None):
+        # Exact paths keep look-alike files in the watched directories out
+        patterns = [str(path) for path in watched_paths] if watched_paths else self.WATCHED_PATTERNS
+        super().__init__(patterns=patterns, ignore_directories=True)
         self.service = service_instance
-        self.last_reload = datetime.now()
+        self.last_reload = time.monotonic()
         self.reload_count = 0
-        
-    def on_modified(self, event):
-        if event.is_directory:
+        self._pending_files = set()
+        self._timer = None
+        self._timer_lock = threading.Lock()
+    
+    def dispatch(self, event):
+        # Deletions and opens never need a reload
+        if event.event_type not in self.RELOAD_EVENTS:
             return
-            
-        # Only watch for security filter changes
-        if event.src_path.endswith('security_filter.py') or event.src_path.endswith('security_config.json'):
-            try:
-                # Prevent rapid reloads (debounce)
-                if (datetime.now() - self.last_reload).total_seconds() < 2:
-                    return
-                
-                self.last_reload = datetime.now()
-                self.reload_count += 1
-                
-                # Reload the security filter module
-                import security_filter
-                importlib.reload(security_filter)
-                
-                # Create new filter instance
-                old_filter = self.service.security_filter
-                new_filter = security_filter.SecurityFilter(
-                    enable_redaction=old_filter.enable_redaction if old_filter else True,
-                    skip_sensitive=old_filter.skip_sensitive if old_filter else False
-                )
-                
-                # Update service with new filter
-                self.service.security_filter = new_filter
-                
-                # Log the reload with clear indicators
-                reload_id = f"RELOAD-{self.reload_count:03d}"
-                self.service.logger.info(f"[RELOAD] {reload_id}: Security filter HOT-RELOADED successfully!")
-                self.service.logger.info(f"[RELOAD] {reload_id}: File changed: {os.path.basename(event.src_path)}")
+        super().dispatch(event)
+    
+    def on_any_event(self, event):
+        # Editors often save by renaming a temp file over the target
+        path = getattr(event, 'dest_path', '') or event.src_path
+        changed_file = os.path.basename(path)
+        if changed_file not in ('security_filter.py', 'security_config.json'):
+            changed_file = os.path.basename(event.src_path)
+        
+        # Restart the trailing timer so a burst of events reloads once
+        with self._timer_lock:
+            self._pending_files.add(changed_file)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.DEBOUNCE_SECONDS, self._reload)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def cancel(self):
+        """Drop any reload still waiting on the debounce timer"""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending_files.clear()
+    
+    def _reload(self):
+        with self._timer_lock:
+            changed_files = self._pending_files
+            self._pending_files = set()
+            self._timer = None
+        if changed_files:
+            self.apply_reload(changed_files)
+    
+    def apply_reload(self, changed_files):
+        """Reload the security filter after the given files changed"""
+        changed_file = ', '.join(sorted(changed_files))
+        
+        try:
+            self.last_reload = time.monotonic()
+            self.reload_count += 1
+            
+            # Only re-import the module when its code changed; a config
+            # edit just rebuilds the filter from security_config.json
+            if 'security_filter.py' in changed_files:
+                importlib.reload(security_filter_module)
+            
+            # Parse the config up front so a half-saved file raises here
+            # and the service keeps the old filter instead of losing it
+            self.service._raw_config = self.service._read_config()
+            
+            # Create new filter instance (custom patterns and flags come from the config)
+            old_filter = self.service.security_filter
+            new_filter = self.service._load_security_config()
+            
+            # Update service with new filter; its detection cache starts empty
+            self.service.security_filter = new_filter
+            
+            # Log the reload with clear indicators
+            reload_id = f"RELOAD-{self.reload_count:03d}"
+            self.service.logger.info(f"[RELOAD] {reload_id}: Security filter HOT-RELOADED successfully!")
+            self.service.logger.info(f"[RELOAD] {reload_id}: File changed: {changed_file}")
+            if new_filter:
                 self.service.logger.info(f"[RELOAD] {reload_id}: New patterns loaded: {len(new_filter.patterns)} pattern groups")
-                self.service.logger.info(f"[RELOAD] {reload_id}: Filter version: {id(new_filter)} (old: {id(old_filter)})")
-                
-                # Print to console for immediate feedback
-                print(f"\n[RELOAD] {reload_id}: SECURITY FILTER HOT-RELOADED!")
-                print(f"[RELOAD] {reload_id}: You are now on the NEW code path")
-                print(f"[RELOAD] {reload_id}: Filter ID: {id(new_filter)}")
-                print(f"[RELOAD] {reload_id}: Ready to test new patterns!\n")
-                
-            except Exception as e:
-                self.service.logger.error(f"[ERROR] HOT-RELOAD FAILED: {e}")
-                print(f"\n[ERROR] HOT-RELOAD FAILED: {e}")
-                print("[ERROR] Service continues with OLD code path\n")
+            else:
+                self.service.logger.warning(f"[RELOAD] {reload_id}: Security filtering is now disabled")
+            self.service.logger.info(f"[RELOAD] {reload_id}: Filter version: {id(new_filter)} (old: {id(old_filter)})")
+            
+            # Print to console for immediate feedback
+            print(f"\n[RELOAD] {reload_id}: SECURITY FILTER HOT-RELOADED!")
+            print(f"[RELOAD] {reload_id}: You are now on the NEW code path")
+            print(f"[RELOAD] {reload_id}: Filter ID: {id(new_filter)}")
+            print(f"[RELOAD] {reload_id}: Ready to test new patterns!\n")
+            
+        except Exception as e:
+            self.service.logger.error(f"[ERROR] HOT-RELOAD FAILED: {e}")
+            print(f"\n[ERROR] HOT-RELOAD FAILED: {e}")
+            print("[ERROR] Service continues with OLD code path\n")
 
 class RobustClipboardService:
+    # Base64 prefixes of clipboard image payloads: PNG, JPEG, data URL
+    _IMG_PREFIXES = ('iVBORw0KGgo', '/9j/', 'data:image/')
+    
+    # JPEG quality ladder and the rough bits-per-pixel each level needs on screenshots
+    JPEG_QUALITIES = (90, 85, 70, 50)
+    JPEG_MIN_BPP = (3.0, 1.5, 0.8, 0.0)
+    
+    # Returned by import_text_content once the upload is handed to the worker
+    UPLOAD_QUEUED = "QUEUED_FOR_UPLOAD"
+    
+    # Text longer than this is UTF-8 encoded for hashing one slice at a time
+    HASH_CHUNK_CHARS = 1 << 20
+    
+    # A clipboard read that fails while waiting on change notifications is
+    # retried this many times, backing off by this many seconds per attempt
+    CLIPBOARD_READ_RETRIES = 5
+    CLIPBOARD_RETRY_DELAY = 0.1
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.pieces_client = PiecesClient(host="http://localhost:39300")
@@ -116,17 +229,55 @@ class RobustClipboardService:
         self.pieces_dir = Path.home() / ".clipboard-to-pieces"
         self.pieces_dir.mkdir(exist_ok=True)
         
-        # Track processed clipboard items with timestamps
-        self.processed_items = {}
+        # Track processed clipboard items with timestamps, least recently seen first
+        self.processed_items = OrderedDict()
         self.max_cache_size = 100
         
+        # Clipboard items are processed on a worker pool; _lock guards
+        # processed_items, the in-flight set, the result caches and the
+        # state manager, which all worker threads share
+        self._lock = threading.RLock()
+        self._in_flight = set()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="clipboard-worker")
+        self._pending_items = threading.BoundedSemaphore(8)
+        # Compression runs here while the worker thread OCRs the same image
+        self._compress_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="compress")
+        
+        # Clipboard sequence number seen by the last detection
+        self._clipboard_seq = None
+        self._read_retries = 0
+        
+        # Set by stop() (or SIGINT/SIGTERM) to end run_service promptly
+        self._stop_event = threading.Event()
+        
         # Get application info once
         self.application = self._get_application()
         
+        # Metadata templates; only description/tags change per event, so each
+        # import clones one of these instead of re-validating a new model
+        self._text_metadata_template = FragmentMetadata(
+            ext=ClassificationSpecificEnum.TXT,
+            tags=["text", "clipboard", "auto-imported"],
+            description=""
+        )
+        self._image_fallback_metadata_template = FragmentMetadata(
+            ext=ClassificationSpecificEnum.JPG,
+            tags=["image", "clipboard", "auto-imported", "compressed", "fallback"],
+            description=""
+        )
+        
         # Image compression settings
         self.max_image_size = 500000  # 500KB limit
         self.max_dimensions = (1920, 1080)  # Max width/height
         
+        # Parse security_config.json once; both loaders read from this dict
+        self._config_path = Path(__file__).parent.parent / "security_config.json"
+        try:
+            self._raw_config = self._read_config()
+        except Exception as e:
+            self.logger.error(f"Failed to read security_config.json: {e}")
+            self._raw_config = {}
+        
         # Initialize security filter
         self.security_filter = self._load_security_config()
         
@@ -134,6 +285,12 @@ class RobustClipboardService:
         self.ocr_service = get_ocr_service()
         self.ocr_config = self._load_ocr_config()
         
+        # OCR results keyed by clipboard fingerprint (LRU), so a repeated
+        # screenshot is not run through Tesseract again; text-only and
+        # text-with-boxes results share the cache under distinct keys
+        self._ocr_cache = OrderedDict()
+        self._ocr_cache_size = 256
+        
         # Initialize agentic components
         self.context_analyzer = ContextAnalyzer()
         self.state_manager = StateManager()
@@ -143,8 +300,16 @@ class RobustClipboardService:
         # Register feedback handlers
         self._register_feedback_handlers()
         
+        # Text uploads go through a bounded queue to a worker thread, so a slow
+        # Pieces OS round trip never stalls clipboard polling
+        self._upload_queue = queue.Queue(maxsize=64)
+        self._upload_thread = threading.Thread(target=self._upload_worker, name="pieces-upload", daemon=True)
+        self._upload_thread.start()
+        
         # Initialize file watcher for hot reloading
         self.file_observer = None
+        self._watch_thread = None
+        self._reloader = None
         self._start_file_watcher()
         
         self.logger.info("Robust Clipboard Monitoring Service Initialized")
@@ -220,41 +385,43 @@ class RobustClipboardService:
             self.logger.error(f"Failed to create default application: {e}")
             return None
     
+    def _read_config(self):
+        """Parse security_config.json, or return None if it does not exist (raises on invalid JSON)"""
+        if not self._config_path.exists():
+            return None
+        with open(self._config_path, 'r') as f:
+            return json.load(f)
+    
     def _load_security_config(self):
-        """Load security configuration and initialize filter"""
+        """Initialize the security filter from the cached security config"""
         try:
-            # Look for security config file
-            config_path = Path(__file__).parent.parent / "security_config.json"
-            
-            if not config_path.exists():
+            if self._raw_config is None:
                 self.logger.warning("No security_config.json found - security filtering disabled")
                 return None
             
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            
-            security_config = config.get('security_filter', {})
+            security_config = self._raw_config.get('security_filter', {})
             
             if not security_config.get('enabled', False):
                 self.logger.warning("Security filtering disabled in config")
                 return None
             
             # Initialize security filter with config
-            security_filter = SecurityFilter(
+            # Look the class up on the module so hot reloads pick up new code
+            security_filter = security_filter_module.SecurityFilter(
                 enable_redaction=security_config.get('enable_redaction', True),
                 skip_sensitive=security_config.get('skip_sensitive', False)
             )
             
-            # Add custom patterns if configured
+            # Add custom patterns if configured; entries missing a field are
+            # skipped, and the rest are compiled in one batch
+            custom_patterns = []
             for pattern_config in security_config.get('custom_patterns', []):
-                try:
-                    security_filter.add_custom_pattern(
-                        pattern_config['pattern'],
-                        pattern_config['name'],
-                        pattern_config.get('group', 'custom')
-                    )
-                except Exception as e:
-                    self.logger.error(f"Failed to add custom pattern: {e}")
+                if 'pattern' in pattern_config and 'name' in pattern_config:
+                    custom_patterns.append(pattern_config)
+                else:
+                    self.logger.error(f"Failed to add custom pattern: missing 'pattern' or 'name' in {pattern_config}")
+            if custom_patterns:
+                security_filter.add_custom_patterns(custom_patterns)
             
             self.logger.info("Security filter initialized successfully")
             return security_filter
@@ -265,12 +432,9 @@ class RobustClipboardService:
             return None
     
     def _load_ocr_config(self):
-        """Load OCR configuration from security_config.json"""
+        """Load OCR configuration from the cached security config"""
         try:
-            # Look for security config file
-            config_path = Path(__file__).parent.parent / "security_config.json"
-            
-            if not config_path.exists():
+            if self._raw_config is None:
                 self.logger.warning("No security_config.json found - using default OCR settings")
                 return {
                     'enabled': True,
@@ -282,10 +446,7 @@ class RobustClipboardService:
                     'local_processing_only': True
                 }
             
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            
-            ocr_config = config.get('ocr', {})
+            ocr_config = self._raw_config.get('ocr', {})
             
             # Set defaults for privacy-focused Tesseract-only configuration
             default_config = {
@@ -320,85 +481,33 @@ class RobustClipboardService:
     def _start_file_watcher(self):
         """Start file watcher for hot reloading security filter
         
-        This method initializes the watchdog observer to monitor for changes
-        in security_filter.py and security_config.json files.
+        When watchfiles is installed, a background thread consumes its native
+        (Rust notify) change batches, which arrive already filtered to the two
+        watched files and debounced. Otherwise a watchdog observer is scheduled
+        on the directories holding security_filter.py and security_config.json;
+        SecurityFilterReloader's patterns drop events for any other file, and
+        its trailing timer debounces the rest.
         """
         try:
-            # Use Windows-specific approach to avoid threading issues
-            import threading
-            import time
-            
-            # Create a simple polling-based file watcher instead of watchdog
-            self.file_watcher_active = True
             self.watched_files = {
-                'security_filter.py': Path(__file__).parent / 'security_filter.py',
-                'security_config.json': Path(__file__).parent.parent / 'security_config.json'
+                'security_filter.py': (Path(__file__).parent / 'security_filter.py').resolve(),
+                'security_config.json': self._config_path.resolve()
             }
-            self.file_timestamps = {}
-            
-            # Initialize timestamps
-            for name, path in self.watched_files.items():
-                if path.exists():
-                    self.file_timestamps[name] = path.stat().st_mtime
             
-            def file_watcher_loop():
-                reload_count = 0
-                while self.file_watcher_active:
-                    try:
-                        for name, path in self.watched_files.items():
-                            if path.exists():
-                                current_mtime = path.stat().st_mtime
-                                if name in self.file_timestamps and current_mtime > self.file_timestamps[name]:
-                                    # File changed!
-                                    reload_count += 1
-                                    reload_id = f"RELOAD-{reload_count:03d}"
-                                    
-                                    try:
-                                        # Reload the security filter module
-                                        import security_filter
-                                        importlib.reload(security_filter)
-                                        
-                                        # Create new filter instance
-                                        old_filter = self.security_filter
-                                        new_filter = security_filter.SecurityFilter(
-                                            enable_redaction=old_filter.enable_redaction if old_filter else True,
-                                            skip_sensitive=old_filter.skip_sensitive if old_filter else False
-                                        )
-                                        
-                                        # Update service with new filter
-                                        self.security_filter = new_filter
-                                        
-                                        # Log the reload with clear indicators
-                                        self.logger.info(f"[RELOAD] {reload_id}: Security filter HOT-RELOADED successfully!")
-                                        self.logger.info(f"[RELOAD] {reload_id}: File changed: {name}")
-                                        self.logger.info(f"[RELOAD] {reload_id}: New patterns loaded: {len(new_filter.patterns)} pattern groups")
-                                        self.logger.info(f"[RELOAD] {reload_id}: Filter version: {id(new_filter)} (old: {id(old_filter)})")
-                                        
-                                        # Print to console for immediate feedback
-                                        print(f"\n[RELOAD] {reload_id}: SECURITY FILTER HOT-RELOADED!")
-                                        print(f"[RELOAD] {reload_id}: You are now on the NEW code path")
-                                        print(f"[RELOAD] {reload_id}: Filter ID: {id(new_filter)}")
-                                        print(f"[RELOAD] {reload_id}: Ready to test new patterns!\n")
-                                        
-                                    except Exception as e:
-                                        self.logger.error(f"[ERROR] HOT-RELOAD FAILED: {e}")
-                                        print(f"\n[ERROR] HOT-RELOAD FAILED: {e}")
-                                        print("[ERROR] Service continues with OLD code path\n")
-                                    
-                                    # Update timestamp
-                                    self.file_timestamps[name] = current_mtime
-                                elif name not in self.file_timestamps:
-                                    self.file_timestamps[name] = current_mtime
-                        
-                        time.sleep(1)  # Check every second
-                        
-                    except Exception as e:
-                        self.logger.error(f"File watcher error: {e}")
-                        time.sleep(5)  # Wait longer on error
-            
-            # Start the file watcher in a separate thread
-            self.file_watcher_thread = threading.Thread(target=file_watcher_loop, daemon=True)
-            self.file_watcher_thread.start()
+            # One handler for both directories so debounce state is shared;
+            # it only matches the two exact paths above
+            self._reloader = SecurityFilterReloader(self, self.watched_files.values())
+            if watch_files is not None:
+                self._watch_stop = threading.Event()
+                self._watch_thread = threading.Thread(target=self._watch_files_loop, name="security-watch", daemon=True)
+                self._watch_thread.start()
+            else:
+                self.file_observer = Observer()
+                for directory in {path.parent for path in self.watched_files.values()}:
+                    self.file_observer.schedule(self._reloader, str(directory), recursive=False)
+                self.file_observer.daemon = True
+                self.file_observer.start()
+            self.file_watcher_active = True
             
             self.logger.info("[HOT-RELOAD] File watcher started - Security filter hot-reloading ENABLED")
             self.logger.info(f"[HOT-RELOAD] Watching: {list(self.watched_files.keys())}")
@@ -407,11 +516,31 @@ class RobustClipboardService:
         except Exception as e:
             self.logger.warning(f"File watcher setup failed: {e}")
             self.logger.info("Service will continue without hot-reloading")
+            self.file_observer = None
+            self._watch_thread = None
+            self.file_watcher_active = False
+    
+    def _watch_files_loop(self):
+        """Apply security filter reloads from watchfiles change batches"""
+        watched = {os.path.normcase(str(path)) for path in self.watched_files.values()}
+        directories = {str(path.parent) for path in self.watched_files.values()}
+        
+        def watch_filter(change, path):
+            return change != Change.deleted and os.path.normcase(path) in watched
+        
+        try:
+            for changes in watch_files(*directories, watch_filter=watch_filter, debounce=200,
+                                       recursive=False, stop_event=self._watch_stop):
+                self._reloader.apply_reload({os.path.basename(path) for _, path in changes})
+        except Exception as e:
+            self.logger.warning(f"File watcher stopped unexpectedly: {e}")
             self.file_watcher_active = False
     
     def clear_processed_cache(self):
         """Clear the processed items cache for testing"""
         self.processed_items.clear()
+        # Let the current clipboard content be read again
+        self._clipboard_seq = None
         self.logger.info("Processed items cache cleared")
     
     def get_security_statistics(self):
@@ -444,7 +573,7 @@ class RobustClipboardService:
             if detected_items:
                 print(f"DETECTED: {test_text}")
                 for item in detected_items:
-                    print(f"   - {item['type']}: {item['match']}")
+                    print(f"   - {item.type}: {item.match}")
             else:
                 print(f"NOT DETECTED: {test_text}")
         
@@ -474,46 +603,125 @@ class RobustClipboardService:
         self.feedback_system.register_handler(FeedbackType.PERFORMANCE, performance_handler)
         self.feedback_system.register_handler(FeedbackType.QUALITY, quality_handler)
     
+    def _start_clipboard_listener(self):
+        """Start listening for clipboard change notifications
+        
+        self._clipboard_changed is set on every WM_CLIPBOARDUPDATE for
+        run_service. Returns True if the listener is running.
+        """
+        self._clipboard_listener = ClipboardChangeListener("ClipboardToPiecesListener")
+        self._clipboard_changed = self._clipboard_listener.changed
+        if self._clipboard_listener.start():
+            return True
+        self._clipboard_listener = None
+        return False
+    
+    def _stop_clipboard_listener(self):
+        """Close the listener window, ending its message pump"""
+        listener = getattr(self, '_clipboard_listener', None)
+        if listener is not None:
+            listener.stop()
+            self._clipboard_listener = None
+    
+    def _retry_clipboard_read(self):
+        """Schedule another read after a failed one
+        
+        When polling, the next poll retries. With change notifications there
+        is no next pass until the clipboard changes again, so the listener's
+        event is re-armed after a short, growing delay, up to
+        CLIPBOARD_READ_RETRIES times.
+        """
+        listener = getattr(self, '_clipboard_listener', None)
+        if listener is None:
+            return
+        if self._read_retries >= self.CLIPBOARD_READ_RETRIES:
+            self.logger.warning("Clipboard stayed busy, giving up on the current content")
+            self._read_retries = 0
+            return
+        self._read_retries += 1
+        listener.signal_later(self.CLIPBOARD_RETRY_DELAY * self._read_retries)
+    
+    def stop(self):
+        """Ask run_service to exit; safe to call from signal handlers and other threads"""
+        self._stop_event.set()
+        # Wake a loop waiting for clipboard notifications
+        clipboard_changed = getattr(self, '_clipboard_changed', None)
+        if clipboard_changed is not None:
+            clipboard_changed.set()
+    
+    def _read_clipboard(self):
+        """Read the clipboard in one OpenClipboard/CloseClipboard cycle
+        
+        Returns (format, data): CF_DIB bytes if an image is present, otherwise
+        the text as a str (CF_UNICODETEXT, falling back to CF_TEXT), or (None, None).
+        Format availability is checked before opening (IsClipboardFormatAvailable
+        does not need an open clipboard), so nothing is opened when none apply.
+        """
+        for clipboard_format in _READ_FORMATS:
+            if win32clipboard.IsClipboardFormatAvailable(clipboard_format):
+                break
+        else:
+            return None, None
+        
+        win32clipboard.OpenClipboard()
+        try:
+            data = win32clipboard.GetClipboardData(clipboard_format)
+        finally:
+            win32clipboard.CloseClipboard()
+        if clipboard_format == _CF_TEXT and isinstance(data, bytes):
+            data = data.decode('mbcs', errors='replace')
+        return clipboard_format, data
+    
     def detect_clipboard_content_type(self):
         """Detect if clipboard contains text or image data"""
         try:
-            # First try to get image data from Windows clipboard
+            # Windows bumps the sequence number on every clipboard change, so an
+            # unchanged number means there is nothing new to read or hash
             try:
-                win32clipboard.OpenClipboard()
-                if win32clipboard.IsClipboardFormatAvailable(win32con.CF_DIB):
-                    # Get image data from clipboard
-                    image_data = win32clipboard.GetClipboardData(win32con.CF_DIB)
-                    win32clipboard.CloseClipboard()
-                    
-                    if image_data:
-                        self.logger.debug("Detected Windows clipboard image data")
-                        return "image", image_data
+                seq = win32clipboard.GetClipboardSequenceNumber()
+            except Exception:
+                seq = None
+            if seq is not None and seq == self._clipboard_seq:
+                return None, None
+            
+            # Read image or text in a single clipboard session
+            try:
+                clipboard_format, clipboard_content = self._read_clipboard()
             except Exception as e:
+                # Leave the sequence number alone so a busy clipboard is retried
                 self.logger.debug(f"Windows clipboard check failed: {e}")
-            finally:
-                try:
-                    win32clipboard.CloseClipboard()
-                except:
-                    pass
+                self._retry_clipboard_read()
+                return None, None
             
-            # Fallback to pyperclip for text and base64 images
-            clipboard_content = pyperclip.paste()
+            # Remember which clipboard generation this content belongs to
+            self._clipboard_seq = seq
+            self._read_retries = 0
             
-            if not clipboard_content:
+            if clipboard_format == _CF_DIB:
+                if clipboard_content:
+                    self.logger.debug("Detected Windows clipboard image data")
+                    return "image", clipboard_content
                 return None, None
             
-            # Check if it's image data (base64)
-            if isinstance(clipboard_content, str):
-                # Check for common image base64 patterns
-                if (clipboard_content.startswith('iVBORw0KGgo') or  # PNG
-                    clipboard_content.startswith('/9j/') or          # JPEG
-                    clipboard_content.startswith('data:image/') or  # Data URL
-                    len(clipboard_content) > 1000 and all(c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=' for c in clipboard_content[:100])):
-                    self.logger.debug("Detected base64 image data")
-                    return "image", clipboard_content
+            # Narrow to text once; everything below works on a str
+            if not clipboard_content or not isinstance(clipboard_content, str):
+                return None, None
+            
+            # Check for common image base64 patterns (PNG, JPEG, data URL) in one call
+            if clipboard_content.startswith(self._IMG_PREFIXES):
+                self.logger.debug("Detected base64 image data")
+                return "image", clipboard_content
+            
+            # Rare fallback: long, unprefixed base64 blob. isascii() reads the
+            # string's stored kind flag (O(1)), so any text with non-ASCII
+            # characters skips the scan; the regex checks the head in C
+            if (len(clipboard_content) > 1000 and clipboard_content.isascii()
+                    and _B64_RE.match(clipboard_content, 0, 100)):
+                self.logger.debug("Detected base64 image data")
+                return "image", clipboard_content
             
             # Check if it's text content
-            if isinstance(clipboard_content, str) and len(clipboard_content.strip()) > 0:
+            if not clipboard_content.isspace():
                 self.logger.debug("Detected text content")
                 return "text", clipboard_content
             
@@ -523,90 +731,158 @@ class RobustClipboardService:
             self.logger.debug(f"Error checking clipboard: {e}")
             return None, None
     
-    def compress_image(self, image_path):
-        """Compress image to reduce size for upload"""
+    def _initial_quality_index(self, size):
+        """Pick the first JPEG quality to try from the bits-per-pixel budget"""
+        bits_per_pixel = self.max_image_size * 8 / max(1, size[0] * size[1])
+        for index, min_bpp in enumerate(self.JPEG_MIN_BPP):
+            if bits_per_pixel >= min_bpp:
+                return index
+        return len(self.JPEG_QUALITIES) - 1
+    
+    def compress_image(self, image, source_bytes=None):
+        """Compress a PIL image to JPEG bytes small enough for upload
+        
+        The image is not modified (OCR may be reading it concurrently).
+        source_bytes are the encoded bytes the image was decoded from; a JPEG
+        that already fits the size and dimension limits, or a PNG under half
+        the size limit, is returned as is.
+        """
         try:
-            with Image.open(image_path) as img:
-                # Convert to RGB if necessary
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    img = img.convert('RGB')
-                
-                # Resize if too large
-                if img.size[0] > self.max_dimensions[0] or img.size[1] > self.max_dimensions[1]:
-                    img.thumbnail(self.max_dimensions, Image.Resampling.LANCZOS)
-                    self.logger.info(f"Resized image to {img.size}")
-                
-                # Save compressed version
-                compressed_path = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-                
-                # Try different quality levels to get under size limit
-                for quality in [90, 85, 70, 50]:
-                    img.save(compressed_path.name, 'JPEG', quality=quality, optimize=True)
-                    
-                    # Check file size
-                    file_size = os.path.getsize(compressed_path.name)
-                    self.logger.info(f"Compressed image: {file_size} bytes (quality: {quality})")
-                    
-                    if file_size <= self.max_image_size:
-                        break
+            img = image
+            
+            # Already a small enough JPEG: skip the decode/re-encode round trip
+            if (source_bytes is not None and img.format == 'JPEG'
+                    and len(source_bytes) <= self.max_image_size
+                    and img.size[0] <= self.max_dimensions[0]
+                    and img.size[1] <= self.max_dimensions[1]):
+                self.logger.info(f"Image already within limits: {len(source_bytes)} bytes, not recompressing")
+                return source_bytes
+            
+            # Small PNG (typical UI snippet): a JPEG encode would cost time
+            # and often come out larger, so upload the PNG itself
+            if (source_bytes is not None and img.format == 'PNG'
+                    and len(source_bytes) <= self.max_image_size // 2
+                    and img.size[0] <= self.max_dimensions[0]
+                    and img.size[1] <= self.max_dimensions[1]):
+                self.logger.info(f"Small PNG: {len(source_bytes)} bytes, uploading without JPEG compression")
+                return source_bytes
+            
+            # Convert to RGB if necessary
+            if img.mode in ('RGBA', 'LA', 'P'):
+                img = img.convert('RGB')
+            
+            # Resize if too large (BOX is an area average, like OpenCV's
+            # INTER_AREA: the right filter for downscaling and far cheaper
+            # than LANCZOS)
+            if img.size[0] > self.max_dimensions[0] or img.size[1] > self.max_dimensions[1]:
+                ratio = min(self.max_dimensions[0] / img.size[0], self.max_dimensions[1] / img.size[1])
+                new_size = (max(1, round(img.size[0] * ratio)), max(1, round(img.size[1] * ratio)))
+                img = img.resize(new_size, Image.Resampling.BOX)
+                self.logger.info(f"Resized image to {img.size}")
+            
+            # Encode in memory, starting at the quality predicted to fit the
+            # size budget, and only step down if the estimate was too high
+            buffer = io.BytesIO()
+            qualities = self.JPEG_QUALITIES[self._initial_quality_index(img.size):]
+            for quality in qualities:
+                buffer.seek(0)
+                buffer.truncate()
+                # Progressive scans with 4:2:0 chroma come out a few percent
+                # smaller at the same quality, so more images fit on the first try
+                img.save(buffer, 'JPEG', quality=quality, optimize=True, progressive=True, subsampling=2)
                 
-                return compressed_path.name
+                # Check encoded size
+                file_size = buffer.tell()
+                self.logger.info(f"Compressed image: {file_size} bytes (quality: {quality})")
                 
+                if file_size <= self.max_image_size:
+                    break
+            
+            return buffer.getvalue()
+            
         except Exception as e:
             self.logger.error(f"Error compressing image: {e}")
             return None
     
-    def save_image_to_file(self, image_data):
-        """Save clipboard image data to temporary file"""
+    def load_clipboard_image(self, image_data):
+        """Decode clipboard image data (CF_DIB bytes or base64) into a PIL image in memory
+        
+        Returns (image, image_bytes), where image_bytes is the encoded data the
+        image was decoded from, or (None, None) if the data is not an image.
+        """
         try:
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-            temp_path = Path(temp_file.name)
-            
             # Handle different image data formats
             if isinstance(image_data, bytes):
-                # Windows clipboard image data
-                temp_file.write(image_data)
+                # Windows clipboard image data: CF_DIB is always a headerless
+                # bitmap, so decode it with the DIB plugin directly instead of
+                # letting Image.open probe every registered format
+                image_opener = BmpImagePlugin.DibImageFile
+                image_bytes = image_data
             elif image_data.startswith('data:image/'):
                 # Data URL format
                 base64_data = image_data.split(',')[1]
+                image_opener = Image.open
                 image_bytes = base64.b64decode(base64_data)
-                temp_file.write(image_bytes)
-            elif image_data.startswith('iVBORw0KGgo'):
-                # PNG base64
-                image_bytes = base64.b64decode(image_data)
-                temp_file.write(image_bytes)
             else:
-                # Assume base64
+                # PNG/JPEG or other base64
+                image_opener = Image.open
                 image_bytes = base64.b64decode(image_data)
-                temp_file.write(image_bytes)
-            
-            temp_file.close()
             
-            # Verify it's a valid image
+            # Decode fully now so invalid data is rejected here
             try:
-                with Image.open(temp_path) as img:
-                    img.verify()
-                self.logger.info(f"Saved valid image: {temp_path}")
-                return temp_path
+                img = image_opener(io.BytesIO(image_bytes))
+                
+                # Oversized JPEGs: let libjpeg scale down while decoding (1/2,
+                # 1/4, 1/8), staying at least twice max_dimensions so the
+                # final resize and OCR still have detail to work with
+                if img.format == 'JPEG':
+                    draft_size = (self.max_dimensions[0] * 2, self.max_dimensions[1] * 2)
+                    full_size = img.size
+                    img.draft('RGB', draft_size)
+                    if img.size != full_size:
+                        self.logger.info(f"JPEG draft decode: {full_size[0]}x{full_size[1]} -> {img.size[0]}x{img.size[1]}")
+                
+                img.load()
+                self.logger.info(f"Loaded valid clipboard image: {img.size[0]}x{img.size[1]} {img.mode}")
+                return img, image_bytes
             except Exception:
-                os.unlink(temp_path)
                 self.logger.warning("Invalid image data in clipboard")
-                return None
+                return None, None
                 
         except Exception as e:
-            self.logger.error(f"Error saving clipboard image: {e}")
-            return None
+            self.logger.error(f"Error loading clipboard image: {e}")
+            return None, None
     
     def create_filename(self, content_type):
         """Create a unique filename based on content type"""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        # time.strftime formats the current local time without building a datetime
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
         if content_type == "image":
             return f"Screenshot_{timestamp}.jpg"  # Use JPG for compressed images
         else:
             return f"Text_{timestamp}.txt"
     
+    def _upload_worker(self):
+        """Drain the upload queue, creating one Pieces asset per job (None stops the worker)"""
+        while True:
+            job = self._upload_queue.get()
+            try:
+                if job is None:
+                    return
+                content, metadata = job
+                asset_id = self.pieces_client.create_asset(content, metadata)
+                self.logger.info(f"SUCCESS: Text content imported with ID: {asset_id}")
+            except Exception as e:
+                self.logger.error(f"Error importing text content: {e}")
+            finally:
+                self._upload_queue.task_done()
+    
     def import_text_content(self, text_content):
-        """Import text content to Pieces OS as text (simple method)"""
+        """Import text content to Pieces OS as text (simple method)
+        
+        Filtering happens here; the upload itself is queued for the worker
+        thread and UPLOAD_QUEUED is returned.
+        """
         try:
             self.logger.info(f"Importing text content ({len(text_content)} chars)")
             
@@ -626,32 +902,55 @@ class RobustClipboardService:
                     self.logger.info(f"Applied security filtering: {len(detected_items)} items processed")
                     print(f"\nSECURITY: Sensitive content detected in text and redacted from Pieces.app")
             
-            # Create metadata for text
-            tags = ["text", "clipboard", "auto-imported"] + security_tags
-            
             # Create description with security notice if sensitive content detected
-            description = f"Text content captured from clipboard: {datetime.now().isoformat()}"
+            description = f"Text content captured from clipboard: {_now_iso()}"
+            update = {"description": description}
             if security_tags:
                 description += " | Sensitive content detected and redacted"
+                update = {
+                    "description": description,
+                    "tags": self._text_metadata_template.tags + security_tags
+                }
             
-            metadata = FragmentMetadata(
-                ext=ClassificationSpecificEnum.TXT,
-                tags=tags,
-                description=description
-            )
+            # Create metadata for text from the template
+            metadata = self._text_metadata_template.model_copy(update=update)
             
-            # Create asset with filtered content (simple method)
-            asset_id = self.pieces_client.create_asset(filtered_content, metadata)
+            # Queue asset creation with filtered content (simple method);
+            # drop rather than block when Pieces OS can't keep up
+            try:
+                self._upload_queue.put_nowait((filtered_content, metadata))
+            except queue.Full:
+                self.logger.warning("Upload queue full - text content not sent to Pieces OS")
+                return None
             
-            self.logger.info(f"SUCCESS: Text content imported with ID: {asset_id}")
-            return asset_id
+            return self.UPLOAD_QUEUED
             
         except Exception as e:
             self.logger.error(f"Error importing text content: {e}")
             return None
     
-    def extract_text_from_image(self, image_path):
-        """Extract text from image using OCR for security filtering"""
+    def _ocr_cache_get(self, key):
+        """Look up an OCR result; returns (hit, value) since None is a valid cached result"""
+        with self._lock:
+            if key not in self._ocr_cache:
+                return False, None
+            self._ocr_cache.move_to_end(key)
+            return True, self._ocr_cache[key]
+    
+    def _ocr_cache_put(self, key, value):
+        """Store an OCR result, evicting the least recently used entry when full"""
+        with self._lock:
+            self._ocr_cache[key] = value
+            self._ocr_cache.move_to_end(key)
+            if len(self._ocr_cache) > self._ocr_cache_size:
+                self._ocr_cache.popitem(last=False)
+    
+    def extract_text_from_image(self, image, cache_key=None):
+        """Extract text from image (PIL image or path) using OCR for security filtering
+        
+        When cache_key (the clipboard fingerprint) is given, results are cached
+        so the same screenshot is only OCR'd once.
+        """
         if not self.ocr_config.get('enabled', True):
             self.logger.debug("OCR disabled in configuration")
             return None
@@ -660,24 +959,38 @@ class RobustClipboardService:
             self.logger.debug("OCR not available, skipping text extraction")
             return None
         
+        if cache_key is not None:
+            cached, extracted_text = self._ocr_cache_get(cache_key)
+            if cached:
+                self.logger.debug("Using cached OCR result for image")
+                return extracted_text
+        
         try:
             self.logger.info("Extracting text from image using OCR...")
-            extracted_text, success = self.ocr_service.extract_text(image_path)
+            extracted_text, success = self.ocr_service.extract_text(image)
             
             if success and extracted_text.strip():
                 self.logger.info(f"OCR extracted {len(extracted_text)} characters from image")
                 self.logger.debug(f"OCR extracted text: {extracted_text[:200]}...")  # First 200 chars for debugging
-                return extracted_text
             else:
                 self.logger.debug("No text extracted from image")
-                return None
+                extracted_text = None
+            
+            if cache_key is not None:
+                self._ocr_cache_put(cache_key, extracted_text)
+            
+            return extracted_text
                 
         except Exception as e:
             self.logger.error(f"OCR text extraction failed: {e}")
             return None
     
-    def extract_text_from_image_with_boxes(self, image_path):
-        """Extract text from image using OCR with bounding boxes for redaction"""
+    def extract_text_from_image_with_boxes(self, image_path, cache_key=None):
+        """Extract text from image using OCR with bounding boxes for redaction
+        
+        When cache_key (the clipboard fingerprint) is given, results are cached
+        like extract_text_from_image.
+        """
         if not self.ocr_config.get('enabled', True):
             self.logger.debug("OCR disabled in configuration")
             return None, False, []
@@ -686,6 +999,12 @@ class RobustClipboardService:
             self.logger.debug("OCR not available, skipping text extraction")
             return None, False, []
         
+        if cache_key is not None:
+            cached, result = self._ocr_cache_get((cache_key, 'boxes'))
+            if cached:
+                self.logger.debug("Using cached OCR result with boxes for image")
+                return result
+        
         try:
             self.logger.info("Extracting text from image using OCR with bounding boxes...")
             extracted_text, success, bounding_boxes = self.ocr_service.extract_text_with_boxes(image_path)
@@ -693,10 +1012,15 @@ class RobustClipboardService:
             if success and extracted_text.strip():
                 self.logger.info(f"OCR extracted {len(extracted_text)} characters from image with {len(bounding_boxes)} bounding boxes")
                 self.logger.debug(f"OCR extracted text: {extracted_text[:200]}...")  # First 200 chars for debugging
-                return extracted_text, success, bounding_boxes
+                result = (extracted_text, success, bounding_boxes)
             else:
                 self.logger.debug("No text extracted from image")
-                return None, False, []
+                result = (None, False, [])
+            
+            if cache_key is not None:
+                self._ocr_cache_put((cache_key, 'boxes'), result)
+            
+            return result
                 
         except Exception as e:
             self.logger.error(f"OCR text extraction with boxes failed: {e}")
@@ -705,26 +1029,33 @@ class RobustClipboardService:
     def redact_sensitive_areas_in_image(self, image_path, detected_items, bounding_boxes):
         """Draw black rectangles over sensitive areas in the image using OCR bounding boxes"""
         try:
-            from PIL import Image, ImageDraw
+            from PIL import Image, ImageColor
             
             # Open the image
             with Image.open(image_path) as img:
-                # Create a copy to draw on
-                redacted_img = img.copy()
-                draw = ImageDraw.Draw(redacted_img)
+                # Lowercase every box once and index boxes by word, so each
+                # sensitive item checks the boxes sharing a word with it first
+                boxes_lc = [box['text'].lower() for box in bounding_boxes]
+                token_index = defaultdict(list)
+                for index, box_text in enumerate(boxes_lc):
+                    for token in set(box_text.split()):
+                        token_index[token].append(index)
                 
-                # Draw black rectangles over detected sensitive areas
-                redacted_count = 0
+                # First pass: find the rectangles to cover, without touching pixels
+                rects_to_draw = []
                 for item in detected_items:
                     # Find matching bounding box for this sensitive text
-                    sensitive_text = item['match'].lower()
+                    sensitive_text = item.match.lower()
+                    candidates = sorted({index for token in sensitive_text.split()
+                                         for index in token_index.get(token, ())})
                     
-                    for box in bounding_boxes:
-                        box_text = box['text'].lower()
+                    # Fall back to scanning every box for partial-word matches
+                    for index in chain(candidates, range(len(bounding_boxes))):
+                        box = bounding_boxes[index]
+                        box_text = boxes_lc[index]
                         
                         # Check if this bounding box contains the sensitive text
                         if sensitive_text in box_text or box_text in sensitive_text:
-                            # Draw black rectangle over the sensitive area
                             x1 = box['x']
                             y1 = box['y']
                             x2 = x1 + box['width']
@@ -737,51 +1068,52 @@ class RobustClipboardService:
                             x2 = min(img.width, x2 + padding)
                             y2 = min(img.height, y2 + padding)
                             
-                            # Draw black rectangle
-                            draw.rectangle([x1, y1, x2, y2], fill='black')
-                            
-                            self.logger.debug(f"Redacted sensitive area: {item['type']} '{item['match']}' at ({x1},{y1})-({x2},{y2})")
-                            redacted_count += 1
+                            rects_to_draw.append((x1, y1, x2, y2))
+                            self.logger.debug(f"Redacting sensitive area: {item.type} '{item.match}' at ({x1},{y1})-({x2},{y2})")
                             break  # Found match, move to next sensitive item
                 
-                if redacted_count > 0:
-                    # Save redacted image
-                    redacted_path = image_path.replace('.png', '_redacted.png').replace('.jpg', '_redacted.jpg')
-                    redacted_img.save(redacted_path)
-                    
-                    self.logger.info(f"Created redacted image with {redacted_count} sensitive areas covered: {redacted_path}")
-                    return redacted_path
-                else:
+                # Common case for clean screenshots: no pixel copy at all
+                if not rects_to_draw:
                     self.logger.debug("No sensitive areas found to redact")
                     return image_path
                 
+                # Create a copy to draw on (palette images can't take a plain
+                # colour fill, so those are converted to RGB instead)
+                redacted_img = img.convert('RGB') if img.mode == 'P' else img.copy()
+                
+                # Resolve the fill colour once; each box is then filled with
+                # Image.paste, a C-level fill with no per-call colour parsing
+                fill = ImageColor.getcolor('black', redacted_img.mode)
+                for x1, y1, x2, y2 in rects_to_draw:
+                    # Paste boxes exclude the far edge, so +1 to cover the
+                    # same pixels as ImageDraw.rectangle()
+                    redacted_img.paste(fill, (x1, y1, x2 + 1, y2 + 1))
+                
+                # Save redacted image (fast zlib level for PNG; the file is
+                # short-lived and size matters less than latency here)
+                redacted_path = image_path.replace('.png', '_redacted.png').replace('.jpg', '_redacted.jpg')
+                if redacted_path.endswith('.png'):
+                    redacted_img.save(redacted_path, optimize=False, compress_level=1)
+                else:
+                    redacted_img.save(redacted_path)
+                
+                self.logger.info(f"Created redacted image with {len(rects_to_draw)} sensitive areas covered: {redacted_path}")
+                return redacted_path
+                
         except Exception as e:
             self.logger.error(f"Failed to redact sensitive areas in image: {e}")
             return image_path  # Return original if redaction fails
     
-    def import_image_as_binary_file(self, image_path, filename):
-        """Import image file to Pieces OS using proper binary upload with compression"""
+    def import_image_as_binary_file(self, image_data, filename):
+        """Import compressed JPEG bytes to Pieces OS using proper binary upload"""
         try:
             self.logger.info(f"Importing image file as compressed binary: {filename}")
             
-            # OCR disabled - skip text extraction and security filtering
-            extracted_text = None
-            security_info = None
-            redacted_image_path = image_path
-            
-            # Compress the redacted image (or original if no redaction)
-            compressed_path = self.compress_image(redacted_image_path)
-            if not compressed_path:
-                self.logger.error("Failed to compress image")
-                return None
-            
             try:
-                # Read compressed image file
-                with open(compressed_path, 'rb') as f:
-                    image_data = f.read()
-                
                 file_size = len(image_data)
                 self.logger.info(f"Compressed image size: {file_size} bytes")
+                image_ext = (ClassificationSpecificEnum.PNG if image_data[:8] == _PNG_SIGNATURE
+                             else ClassificationSpecificEnum.JPG)
                 
                 if file_size > self.max_image_size:
                     self.logger.warning(f"Image still too large after compression: {file_size} bytes")
@@ -791,37 +1123,21 @@ class RobustClipboardService:
                 try:
                     self.logger.info("Creating image asset using binary upload method...")
                     
-                    # Read the compressed image file
-                    with open(compressed_path, 'rb') as f:
-                        image_data = f.read()
-
-                    # Create metadata for image
-                    tags = ["image", "clipboard", "auto-imported", "compressed"]
-                    description = f"Compressed image captured from clipboard: {datetime.now().isoformat()}"
-
-                    metadata = FragmentMetadata(
-                        ext=ClassificationSpecificEnum.JPG,
-                        tags=tags,
-                        description=description
-                    )
-
                     # Use the original working method from commit 340991a
                     try:
-                        # Convert bytes to array of integers
-                        byte_array = list(image_data)
-                        self.logger.debug(f"Converted {file_size} bytes to {len(byte_array)} integers")
-                        
-                        # Create TransferableBytes
+                        # Create TransferableBytes. The API wants raw as a list of
+                        # ints; list(bytes) builds it in C from cached small ints,
+                        # and model_construct skips pydantic's per-element
+                        # StrictInt check, which dominated this step for large images
                         from pieces_os_client.models.transferable_bytes import TransferableBytes
-                        transferable_bytes = TransferableBytes(raw=byte_array)
+                        transferable_bytes = TransferableBytes.model_construct(raw=list(image_data))
                         
                         # Create SeededFile
                         from pieces_os_client.models.seeded_file import SeededFile
                         seeded_file = SeededFile(bytes=transferable_bytes)
                         
-                        # Create SeededClassification (use JPEG since we compressed to JPEG)
-                        from pieces_os_client.models.seeded_classification import SeededClassification
-                        seeded_classification = SeededClassification(specific=ClassificationSpecificEnum.JPG)
+                        # Create SeededClassification (JPEG unless a small PNG was passed through)
+                        seeded_classification = SeededClassification(specific=image_ext)
                         
                         # Create SeededFormat
                         from pieces_os_client.models.seeded_format import SeededFormat
@@ -853,10 +1169,6 @@ class RobustClipboardService:
                                 self.logger.error(f"Failed to create SeededAsset with application: {e2}")
                                 return None
                         
-                        # Create Seed
-                        from pieces_os_client.models.seed import Seed
-                        seed = Seed(asset=seeded_asset)
-                        
                         # Try binary upload method first (creates proper image assets)
                         try:
                             self.logger.info("Creating image asset via binary upload method...")
@@ -872,19 +1184,22 @@ class RobustClipboardService:
                             # Fallback: Use create_asset with base64 (creates text snippets but at least imports something)
                             self.logger.info("Falling back to create_asset method with base64...")
                             try:
-                                # Read the compressed image file
-                                with open(compressed_path, 'rb') as f:
-                                    image_data = f.read()
-                                
-                                # Create metadata for image
-                                metadata = FragmentMetadata(
-                                    ext=ClassificationSpecificEnum.JPG,
-                                    tags=["image", "clipboard", "auto-imported", "compressed", "fallback"],
-                                    description=f"Compressed image captured from clipboard: {datetime.now().isoformat()} (imported as text due to binary upload failure)"
-                                )
+                                # Create metadata for image from the template
+                                metadata = self._image_fallback_metadata_template.model_copy(update={
+                                    "ext": image_ext,
+                                    "description": f"Compressed image captured from clipboard: {_now_iso()} (imported as text due to binary upload failure)"
+                                })
 
-                                # Use create_asset method with base64 string
-                                base64_data = base64.b64encode(image_data).decode('utf-8')
+                                # Use create_asset method with base64 string, encoded in
+                                # chunks (multiples of 3 bytes, so no padding mid-stream)
+                                # to avoid holding a full-size intermediate bytes copy
+                                encoded = bytearray()
+                                view = memoryview(image_data)
+                                step = 57 * 1024
+                                for start in range(0, len(view), step):
+                                    encoded += base64.b64encode(view[start:start + step])
+                                base64_data = encoded.decode('ascii')
+                                del encoded, view
                                 result_id = self.pieces_client.create_asset(base64_data, metadata)
                                 self.logger.info(f"Image import successful via create_asset fallback: {result_id}")
                                 return result_id
@@ -901,12 +1216,9 @@ class RobustClipboardService:
                     self.logger.error(f"Image import failed: {error}")
                     return None
                 
-            finally:
-                # Clean up compressed file
-                try:
-                    os.unlink(compressed_path)
-                except:
-                    pass
+            except Exception as error:
+                self.logger.error(f"Image import failed: {error}")
+                return None
             
         except Exception as e:
             self.logger.error(f"Error importing image file: {e}")
@@ -915,24 +1227,44 @@ class RobustClipboardService:
                 self.logger.error(f"Response text: {e.response.text}")
             return None
     
+    def _write_atomically(self, path, data):
+        """Write str (UTF-8) or bytes to a sibling .tmp file and rename it over path
+        
+        Watchers of the directory (e.g. Pieces.app auto-import) never see a
+        partially written file.
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+        if isinstance(data, str):
+            tmp_path.write_text(data, encoding="utf-8")
+        else:
+            tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    
     def save_to_pieces_dir(self, content_or_path, filename, content_type, security_info=None):
         """Save files to .clipboard-to-pieces directory only"""
         try:
             # Create the file in .clipboard-to-pieces directory
             file_path = self.pieces_dir / filename
             
-            if content_type == "text":
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content_or_path)
+            if content_type == "text" or isinstance(content_or_path, (bytes, bytearray, memoryview)):
+                # Text or in-memory image data: one write, then an atomic rename
+                self._write_atomically(file_path, content_or_path)
             else:
-                shutil.copy2(content_or_path, file_path)
+                # Hard-link the temp image instead of writing a second copy;
+                # fall back to copying when the link fails (e.g. across drives)
+                try:
+                    os.link(content_or_path, file_path)
+                except OSError:
+                    tmp_path = file_path.with_name(file_path.name + ".tmp")
+                    shutil.copyfile(content_or_path, tmp_path)
+                    os.replace(tmp_path, file_path)
             
             # Create metadata file with security information
             metadata_path = self.pieces_dir / f"{filename}.pieces.json"
             metadata = {
                 "filename": filename,
                 "content_type": content_type,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "source": "clipboard_monitor"
             }
             
@@ -940,8 +1272,13 @@ class RobustClipboardService:
             if security_info:
                 metadata["security"] = security_info
             
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
+            # Serialize once and write in a single call (orjson when installed);
+            # the file is machine-read, so only indent it when debugging
+            pretty = self.logger.isEnabledFor(logging.DEBUG)
+            if orjson is not None:
+                self._write_atomically(metadata_path, orjson.dumps(metadata, option=orjson.OPT_INDENT_2 if pretty else 0))
+            else:
+                self._write_atomically(metadata_path, json.dumps(metadata, indent=2 if pretty else None))
             
             self.logger.info(f"Saved files to: {self.pieces_dir}")
             return True
@@ -950,32 +1287,67 @@ class RobustClipboardService:
             self.logger.error(f"Error saving to .pieces directory: {e}")
             return False
     
-    def process_clipboard_item(self, content_type, content):
-        """Process clipboard item using agentic patterns"""
+    def _fingerprint(self, content):
+        """Hash clipboard content for duplicate detection"""
+        # xxh3 is several times faster than any hashlib digest and is plenty
+        # for in-memory dedup; fall back to an equally wide BLAKE2b digest
+        hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=8)
+        
+        if isinstance(content, str) and len(content) > self.HASH_CHUNK_CHARS:
+            # Large text (base64 images): encode and hash in slices instead of
+            # materialising a second full-size UTF-8 copy; UTF-8 is
+            # concatenative, so the digest matches a one-shot encode
+            for start in range(0, len(content), self.HASH_CHUNK_CHARS):
+                hasher.update(content[start:start + self.HASH_CHUNK_CHARS].encode('utf-8', 'surrogatepass'))
+        elif isinstance(content, str):
+            hasher.update(content.encode('utf-8', 'surrogatepass'))
+        else:
+            # CF_DIB bytes are hashed in place, without a copy
+            hasher.update(memoryview(content))
+        return hasher.hexdigest()
+    
+    def process_clipboard_item(self, content_type, content, item_hash=None):
+        """Process clipboard item using agentic patterns
+        
+        item_hash is the content fingerprint, if the caller already has it;
+        otherwise it is computed here.
+        """
         try:
             # Create unique identifier for this clipboard item
-            if isinstance(content, bytes):
-                item_hash = hashlib.md5(content).hexdigest()
-            else:
-                item_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
+            if item_hash is None:
+                item_hash = self._fingerprint(content)
             
-            current_time = datetime.now()
+            # Monotonic seconds: cheap to compare and immune to clock changes
+            current_time = time.monotonic()
             
-            # Check if we've processed this exact item recently (within last 30 minutes)
-            if item_hash in self.processed_items:
-                last_processed = self.processed_items[item_hash]
-                time_diff = (current_time - last_processed).total_seconds()
+            with self._lock:
+                # Another worker is already handling this exact item
+                if item_hash in self._in_flight:
+                    self.logger.debug("Item is already being processed, skipping duplicate")
+                    return None
                 
-                if time_diff < 1800:  # 30 minutes
-                    self.logger.debug(f"Item processed {time_diff:.1f}s ago, skipping duplicate")
-                    return None  # Return None to indicate no processing was done
-                else:
-                    self.logger.debug(f"Item processed {time_diff:.1f}s ago, processing again")
+                # Check if we've processed this exact item recently (within last 30 minutes)
+                if item_hash in self.processed_items:
+                    last_processed = self.processed_items[item_hash]
+                    time_diff = current_time - last_processed
+                    self.processed_items.move_to_end(item_hash)
+                    
+                    if time_diff < 1800:  # 30 minutes
+                        self.logger.debug(f"Item processed {time_diff:.1f}s ago, skipping duplicate")
+                        return None  # Return None to indicate no processing was done
+                    else:
+                        self.logger.debug(f"Item processed {time_diff:.1f}s ago, processing again")
+                
+                self._in_flight.add(item_hash)
             
             self.logger.info(f"Processing new {content_type} content...")
             
             # Use agentic processing
-            return self._process_with_agentic_patterns(item_hash, content_type, content, current_time)
+            try:
+                return self._process_with_agentic_patterns(item_hash, content_type, content, current_time)
+            finally:
+                with self._lock:
+                    self._in_flight.discard(item_hash)
             
         except Exception as e:
             self.logger.error(f"Error processing clipboard item: {e}")
@@ -997,11 +1369,12 @@ class RobustClipboardService:
         else:
             context = self.context_analyzer.analyze_content("", content_type)
         
-        # Get optimal strategy from state manager
-        optimal_strategy = self.state_manager.get_optimal_strategy(context.content_type.value)
-        
-        # Start processing record
-        record = self.state_manager.start_processing(content_id, context.content_type.value, optimal_strategy)
+        with self._lock:
+            # Get optimal strategy from state manager
+            optimal_strategy = self.state_manager.get_optimal_strategy(context.content_type.value)
+            
+            # Start processing record
+            record = self.state_manager.start_processing(content_id, context.content_type.value, optimal_strategy)
         
         start_time = time.time()
         
@@ -1020,61 +1393,85 @@ class RobustClipboardService:
                 save_success = self.save_to_pieces_dir(content, filename, content_type, None)
                 
             elif content_type == "image":
-                # Save image to temporary file
-                temp_image_path = self.save_image_to_file(content)
-                if not temp_image_path:
-                    self.logger.warning("Failed to save clipboard image")
+                # Decode clipboard image in memory
+                image, image_bytes = self.load_clipboard_image(content)
+                if image is None:
+                    self.logger.warning("Failed to load clipboard image")
                     return False
                 
-                try:
-                    # Extract text from image for security filtering
-                    extracted_text = self.extract_text_from_image(temp_image_path)
-                    security_info = None
-                    
-                    # Apply security filtering to extracted text if available
-                    if extracted_text and self.security_filter and self.ocr_config.get('apply_security_filtering', True):
-                        filtered_text, should_skip, detected_items = self.security_filter.filter_content(extracted_text)
-                        
-                        if should_skip and self.ocr_config.get('skip_images_with_sensitive_text', False):
-                            self.logger.warning("SECURITY: Skipping image import due to sensitive content detected in OCR text")
-                            return None  # Skip processing entirely
-                        
-                        if detected_items:
-                            security_info = {
-                                "ocr_filtered": True,
-                                "extracted_text_length": len(extracted_text),
-                                "detected_items": len(detected_items),
-                                "detection_types": list(set(item['type'] for item in detected_items)),
-                                "filter_timestamp": datetime.now().isoformat()
-                            }
-                            self.logger.info(f"Security filter applied to OCR text: {len(detected_items)} sensitive items processed")
-                            print(f"\n🔒 SECURITY: Sensitive content detected in screenshot and redacted from Pieces.app")
-                    
-                    # Import image as compressed binary file (proper method)
-                    asset_id = self.import_image_as_binary_file(temp_image_path, filename)
-                    
-                    # Handle special case where import was skipped due to sensitivity
-                    if asset_id == "SKIPPED_SENSITIVE":
-                        return None
+                # Extract text from image for security filtering; exact repeats
+                # are answered from the content-keyed OCR cache
+                ocr_active = self.ocr_config.get('enabled', True) and self.ocr_service.is_available()
+                compress_future = None
+                if ocr_active:
+                    # Compress in the background while this thread runs OCR;
+                    # Tesseract and libjpeg both release the GIL, so they overlap
+                    compress_future = self._compress_executor.submit(self.compress_image, image, image_bytes)
+                    extracted_text = self.extract_text_from_image(image, cache_key=content_id)
+                else:
+                    extracted_text = None
+                security_info = None
+                
+                # Apply security filtering to extracted text if available
+                if extracted_text and self.security_filter and self.ocr_config.get('apply_security_filtering', True):
+                    filtered_text, should_skip, detected_items = self.security_filter.filter_content(extracted_text)
                     
-                    # Save original to .pieces directory with security info
-                    save_success = self.save_to_pieces_dir(temp_image_path, filename, content_type, security_info)
+                    if should_skip and self.ocr_config.get('skip_images_with_sensitive_text', False):
+                        self.logger.warning("SECURITY: Skipping image import due to sensitive content detected in OCR text")
+                        if compress_future is not None:
+                            compress_future.cancel()
+                        return None  # Skip processing entirely
                     
-                finally:
-                    # Clean up temporary file
-                    try:
-                        os.unlink(temp_image_path)
-                    except:
-                        pass
+                    if detected_items:
+                        security_info = {
+                            "ocr_filtered": True,
+                            "extracted_text_length": len(extracted_text),
+                            "detected_items": len(detected_items),
+                            "detection_types": list(set(item.type for item in detected_items)),
+                            "filter_timestamp": _now_iso()
+                        }
+                        self.logger.info(f"Security filter applied to OCR text: {len(detected_items)} sensitive items processed")
+                        print(f"\n🔒 SECURITY: Sensitive content detected in screenshot and redacted from Pieces.app")
+                
+                # Compress once in memory (inline when there was no OCR to
+                # overlap with); the same bytes are uploaded and saved
+                if compress_future is not None:
+                    compressed_data = compress_future.result()
+                else:
+                    compressed_data = self.compress_image(image, image_bytes)
+                if compressed_data is None:
+                    self.logger.error("Failed to compress image")
+                    return False
+                if compressed_data[:8] == _PNG_SIGNATURE:
+                    filename = filename[:-len(".jpg")] + ".png"
+                
+                # Import image as compressed binary file (proper method)
+                asset_id = self.import_image_as_binary_file(compressed_data, filename)
+                
+                # Handle special case where import was skipped due to sensitivity
+                if asset_id == "SKIPPED_SENSITIVE":
+                    return None
+                
+                # Save compressed image to .pieces directory with security info
+                save_success = self.save_to_pieces_dir(compressed_data, filename, content_type, security_info)
             else:
                 self.logger.warning(f"Unknown content type: {content_type}")
                 return False
             
             # Mark as processed if file was saved successfully (regardless of API success)
             if save_success:
-                self.processed_items[content_id] = current_time
+                with self._lock:
+                    self.processed_items[content_id] = current_time
+                    self.processed_items.move_to_end(content_id)
+                    
+                    # Clean up old entries to prevent memory growth
+                    while len(self.processed_items) > self.max_cache_size:
+                        self.processed_items.popitem(last=False)
                 
-                if asset_id:
+                if asset_id == self.UPLOAD_QUEUED:
+                    self.logger.info(f"SUCCESS: {content_type.title()} content queued for import as {filename}")
+                    self.logger.info(f"Files saved to .clipboard-to-pieces directory")
+                elif asset_id:
                     self.logger.info(f"SUCCESS: {content_type.title()} content imported as {filename}")
                     self.logger.info(f"Asset ID: {asset_id}")
                     self.logger.info(f"Files saved to .clipboard-to-pieces directory")
@@ -1082,12 +1479,6 @@ class RobustClipboardService:
                     self.logger.info(f"SUCCESS: {content_type.title()} content saved to .clipboard-to-pieces directory")
                     self.logger.info(f"Note: API import failed, but file saved for Pieces.app auto-import")
                 
-                # Clean up old entries to prevent memory growth
-                if len(self.processed_items) > self.max_cache_size:
-                    sorted_items = sorted(self.processed_items.items(), key=lambda x: x[1])
-                    for key, _ in sorted_items[:len(sorted_items) - self.max_cache_size]:
-                        del self.processed_items[key]
-                
                 return True
             else:
                 self.logger.error(f"FAILED: {content_type.title()} content save failed")
@@ -1097,47 +1488,133 @@ class RobustClipboardService:
             self.logger.error(f"Error processing {content_type} content: {e}")
             return False
     
+    def _process_and_report(self, content_type, content, item_hash):
+        """Worker pool entry point: process one clipboard item and log the outcome"""
+        try:
+            success = self.process_clipboard_item(content_type, content, item_hash)
+            
+            # Only log if there was an actual processing attempt (not just skipped duplicate)
+            if success is not None:
+                if success:
+                    self.logger.info(f"{content_type.title()} content successfully imported!")
+                else:
+                    self.logger.warning(f"{content_type.title()} content import failed")
+        except Exception as e:
+            self.logger.error(f"Error in clipboard worker: {e}")
+        finally:
+            self._pending_items.release()
+    
     def run_service(self, check_interval=2):
-        """Run the clipboard monitoring service"""
-        self.logger.info(f"Starting robust clipboard monitoring service (checking every {check_interval} seconds)")
+        """Run the clipboard monitoring service
+        
+        The clipboard is read when Windows reports a change; polling every
+        check_interval seconds is used when change notifications are disabled
+        in security_config.json ("clipboard": {"change_notifications": false})
+        or the listener cannot be started.
+        """
+        use_notifications = (self._raw_config or {}).get('clipboard', {}).get('change_notifications', True)
+        if use_notifications and self._start_clipboard_listener():
+            self.logger.info("Starting robust clipboard monitoring service (clipboard change notifications)")
+            # Check whatever is on the clipboard at startup once
+            self._clipboard_changed.set()
+        else:
+            use_notifications = False
+            self.logger.info(f"Starting robust clipboard monitoring service (checking every {check_interval} seconds)")
+        
+        # Shutdown signals end the loop at its next wait instead of
+        # interrupting whatever it is doing
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(signum, lambda signum, frame: self.stop())
+        
+        # Polling runs on a monotonic schedule, so time spent checking the
+        # clipboard does not push later checks back
+        next_check = time.monotonic()
         
         try:
-            while True:
+            while not self._stop_event.is_set():
                 try:
+                    if use_notifications:
+                        # Short timeout keeps Ctrl+C responsive on Windows
+                        if not self._clipboard_changed.wait(timeout=1):
+                            continue
+                        self._clipboard_changed.clear()
+                        if self._stop_event.is_set():
+                            break
+                    
                     # Check clipboard content type
                     content_type, content = self.detect_clipboard_content_type()
                     
                     if content_type and content:
                         self.logger.debug(f"{content_type.title()} detected in clipboard ({len(content)} chars)")
                         
-                        # Process the clipboard item
-                        success = self.process_clipboard_item(content_type, content)
-                        
-                        # Only log if there was an actual processing attempt (not just skipped duplicate)
-                        if success is not None:
-                            if success:
-                                self.logger.info(f"{content_type.title()} content successfully imported!")
-                            else:
-                                self.logger.warning(f"{content_type.title()} content import failed")
+                        # Hand the item to the worker pool so detection never
+                        # waits on OCR, compression or uploads. When too many
+                        # items are queued, wait for a slot rather than drop
+                        # it: the sequence number has already moved past it
+                        waiting_logged = False
+                        while not self._pending_items.acquire(timeout=1):
+                            if self._stop_event.is_set():
+                                break
+                            if not waiting_logged:
+                                self.logger.warning(f"Too many clipboard items pending - waiting to queue {content_type} content")
+                                waiting_logged = True
+                        else:
+                            item_hash = self._fingerprint(content)
+                            self._executor.submit(self._process_and_report, content_type, content, item_hash)
                     
-                    # Wait before next check
-                    time.sleep(check_interval)
+                    # Wait until the next check is due, waking early on stop()
+                    if not use_notifications:
+                        next_check += check_interval
+                        now = time.monotonic()
+                        if next_check < now:
+                            # Fell more than a whole interval behind: resume
+                            # the cadence from now rather than catching up
+                            next_check = now
+                        self._stop_event.wait(next_check - now)
                     
                 except KeyboardInterrupt:
                     self.logger.info("Service stopped by user")
                     break
                 except Exception as e:
                     self.logger.error(f"Error in service loop: {e}")
-                    time.sleep(check_interval)
+                    self._stop_event.wait(check_interval)
+                    next_check = time.monotonic()
+            
+            if self._stop_event.is_set():
+                self.logger.info("Service stopped")
                     
         except KeyboardInterrupt:
             self.logger.info("Service stopped")
         finally:
+            self._stop_clipboard_listener()
+            
             # Cleanup file watcher
-            if hasattr(self, 'file_watcher_active'):
+            if self._watch_thread is not None:
+                self._watch_stop.set()
+                self._watch_thread.join(timeout=2)
+                self.file_watcher_active = False
+                self.logger.info("File watcher stopped")
+            elif self.file_observer is not None:
+                self.file_observer.stop()
+                self.file_observer.join(timeout=2)
+                self._reloader.cancel()
                 self.file_watcher_active = False
                 self.logger.info("File watcher stopped")
             
+            # Finish in-flight clipboard items, then let queued uploads
+            # finish before the client goes away
+            self._executor.shutdown(wait=True)
+            self._compress_executor.shutdown(wait=True)
+            try:
+                self._upload_queue.put(None, timeout=5)
+            except queue.Full:
+                pass
+            self._upload_thread.join(timeout=10)
+            
+            # Write any batched processing-state changes
+            self.state_manager.flush()
+            self.ocr_service.close()
             self.pieces_client.close()
             self.logger.info("Service shutdown complete")
             
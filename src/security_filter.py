@@ -6,9 +6,83 @@ Detects and filters sensitive information from clipboard content
 
 import re
 import json
-from typing import List, Dict, Tuple, Optional
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional, Union
 from datetime import datetime
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# Leading global inline flags, e.g. "(?i)", which must become scoped flags
+# once a pattern is embedded in a larger alternation
+_GLOBAL_FLAGS_RE = re.compile(r'^\(\?([aiLmsux]+)\)')
+
+# Backreferences would point at the wrong group inside a combined pattern
+_BACKREF_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+# Lowercase literals at least one of which every built-in pattern of a group
+# needs; keep in step with the patterns in SecurityFilter.__init__
+_GROUP_ANCHORS = {
+    'passwords': ('pass', 'pwd'),
+    'api_keys': ('key',),
+    'tokens': ('token', 'bearer'),
+    'database_urls': ('url', 'connection', '://'),
+    'ssh_keys': ('-----begin',),
+    'emails': ('@',),
+    'company_secrets': ('secret', 'pass', 'key'),
+}
+
+# Number-shaped groups have no literal, but every pattern needs three digits in a row
+_DIGIT_GROUPS = frozenset(('credit_cards', 'ssn', 'phone_numbers'))
+_DIGIT_RUN_RE = re.compile(r'\d{3}')
+_DIGITS = object()
+
+_SEVERITY_RANK = {'medium': 0, 'high': 1}
+
+@dataclass
+class DetectedItem:
+    """One sensitive match; far smaller than a per-match dict on large pastes"""
+    # Hand-written rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('type', 'name', 'match', 'start', 'end', 'severity')
+    
+    type: str
+    name: str
+    match: str
+    start: int
+    end: int
+    severity: str
+    
+    def __getitem__(self, key: str):
+        # Callers written against the old dict items still index by field name
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+@lru_cache(maxsize=256)
+def _compile(regex: str) -> re.Pattern:
+    """Compile a pattern with the filter's flags, memoized by source so a
+    config hot reload only compiles patterns (and alternations) that changed"""
+    return re.compile(regex, re.MULTILINE | re.IGNORECASE)
+
+@lru_cache(maxsize=256)
+def _min_match_length(regex: str) -> int:
+    """Shortest text the pattern can match, so shorter content can skip it"""
+    try:
+        return sre_parse.parse(regex, re.MULTILINE | re.IGNORECASE).getwidth()[0]
+    except Exception:
+        return 0
+
 class SecurityFilter:
     """Security filter for detecting and redacting sensitive information
     
@@ -20,6 +94,9 @@ class SecurityFilter:
     Hot-reload test #3: This should trigger RELOAD-002!
     """
     
+    # Recently filtered contents whose detection results are kept for reuse
+    DETECTION_CACHE_SIZE = 128
+    
     def __init__(self, enable_redaction=True, skip_sensitive=False):
         self.enable_redaction = enable_redaction
         self.skip_sensitive = skip_sensitive
@@ -29,6 +106,9 @@ class SecurityFilter:
             'redacted_items': 0,
             'skipped_items': 0
         }
+        # Filtering runs on worker threads; the lock keeps each item's counter
+        # updates and get_statistics' copy from interleaving
+        self._stats_lock = threading.Lock()
         
         # Define sensitive patterns
         self.patterns = {
@@ -95,22 +175,17 @@ class SecurityFilter:
             r'(?i)company[_-]?password\s*[:=]\s*["\']?([^"\'\s]+)["\']?',
             r'(?i)internal[_-]?api[_-]?key\s*[:=]\s*["\']?([^"\'\s]+)["\']?',
         ]
-    
-    def add_custom_pattern(self, pattern: str, name: str, group: str = 'custom'):
-        """Add a custom pattern for detection"""
-        if group not in self.patterns:
-            self.patterns[group] = []
         
-        self.patterns[group].append({
-            'pattern': pattern,
-            'name': name,
-            'custom': True
-        })
+        self._detection_lock = threading.Lock()
+        self._compile_patterns()
     
-    def detect_sensitive_content(self, content: str) -> List[Dict]:
-        """Detect sensitive content in the given text"""
-        detected_items = []
-        
+    def _compile_patterns(self):
+        """Compile every pattern once, tagged with its severity, plus a combined
+        alternation that lets clean content be rejected in a single pass"""
+        compiled = []
+        anchors = []
+        min_lengths = []
+        high_risk = frozenset(self.high_risk_patterns)
         for group, patterns in self.patterns.items():
             for pattern in patterns:
                 if isinstance(pattern, dict):
@@ -123,90 +198,286 @@ class SecurityFilter:
                     name = f"{group}_pattern"
                 
                 try:
-                    matches = re.finditer(regex, content, re.MULTILINE | re.IGNORECASE)
-                    for match in matches:
-                        detected_items.append({
-                            'type': group,
-                            'name': name,
-                            'match': match.group(0),
-                            'start': match.start(),
-                            'end': match.end(),
-                            'severity': 'high' if regex in self.high_risk_patterns else 'medium'
-                        })
-                except re.error as e:
+                    severity = 'high' if regex in high_risk else 'medium'
+                    compiled.append((group, name, regex, _compile(regex), severity))
+                except (re.error, TypeError):
                     # Skip invalid regex patterns
                     continue
+                min_lengths.append(_min_match_length(regex))
+                
+                # Custom patterns (and unknown groups) always run
+                if isinstance(pattern, dict):
+                    anchors.append(None)
+                elif group in _DIGIT_GROUPS:
+                    anchors.append(_DIGITS)
+                else:
+                    anchors.append(_GROUP_ANCHORS.get(group))
+        
+        self._compiled_patterns = compiled
+        self._pattern_anchors = anchors
+        self._min_lengths = min_lengths
+        self._combined_pattern = self._build_combined_pattern([regex for _, _, regex, _, _ in compiled])
+        self._hs_database = self._build_hyperscan_database([regex for _, _, regex, _, _ in compiled])
+        self._hs_scratch = threading.local()
+        # Results computed with the previous pattern set no longer apply
+        self._detection_cache = OrderedDict()
+    
+    @staticmethod
+    def _build_combined_pattern(regexes: List[str]) -> Optional[re.Pattern]:
+        """Join patterns into one alternation, or None if they can't be combined safely"""
+        if not regexes or any(_BACKREF_RE.search(regex) for regex in regexes):
+            return None
+        
+        parts = []
+        for regex in regexes:
+            flags = _GLOBAL_FLAGS_RE.match(regex)
+            if flags:
+                parts.append(f"(?{flags.group(1)}:{regex[flags.end():]})")
+            else:
+                parts.append(f"(?:{regex})")
+        
+        try:
+            return _compile('|'.join(parts))
+        except re.error:
+            return None
+    
+    @staticmethod
+    def _build_hyperscan_database(regexes: List[str]):
+        """Compile every pattern into one Hyperscan database (when installed)
+        that reports which patterns occur in a single DFA pass, or None"""
+        if hyperscan is None or not regexes:
+            return None
+        
+        expressions = []
+        for regex in regexes:
+            # Case-insensitivity is applied through the flags below
+            flags = _GLOBAL_FLAGS_RE.match(regex)
+            if flags and set(flags.group(1)) <= set('im'):
+                regex = regex[flags.end():]
+            expressions.append(regex.encode('utf-8'))
+        
+        flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE
+                 | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY)
+        try:
+            database = hyperscan.Database()
+            database.compile(expressions=expressions, ids=list(range(len(expressions))),
+                             elements=len(expressions), flags=[flags] * len(expressions))
+            return database
+        except Exception:
+            # A pattern Hyperscan can't express: fall back to the re-only path
+            return None
+    
+    def _candidate_patterns(self, content: str, raw: Optional[bytes] = None) -> List[Tuple]:
+        """Patterns that can match content; all of them when no prefilter applies
+        
+        raw, when given, is the UTF-8 bytes content was decoded from; ASCII
+        input is then scanned by Hyperscan as-is instead of being re-encoded.
+        """
+        # The database uses ASCII classes (\d, \s, case folding), so it only
+        # answers exactly like re for ASCII text
+        if self._hs_database is not None and content.isascii():
+            # Scratch space must not be shared between scanning threads
+            scratch = getattr(self._hs_scratch, 'scratch', None)
+            if scratch is None:
+                scratch = self._hs_scratch.scratch = hyperscan.Scratch(self._hs_database)
+            
+            hits = set()
+            data = raw if raw is not None else content.encode('ascii')
+            self._hs_database.scan(data,
+                                   match_event_handler=lambda pattern_id, *_: hits.add(pattern_id),
+                                   scratch=scratch)
+            return [self._compiled_patterns[pattern_id] for pattern_id in sorted(hits)]
+        
+        # Patterns longer than the content can't match it (most pastes of a
+        # token or a word rule out nearly everything); of the rest, substring
+        # checks (C-speed scans) drop built-in patterns whose required literal
+        # is absent; casefold matches re's IGNORECASE
+        length = len(content)
+        folded = content.casefold()
+        has_digits = None
+        candidates = []
+        for entry, anchors, min_length in zip(self._compiled_patterns, self._pattern_anchors, self._min_lengths):
+            if min_length > length:
+                continue
+            if anchors is None:
+                candidates.append(entry)
+            elif anchors is _DIGITS:
+                if has_digits is None:
+                    has_digits = _DIGIT_RUN_RE.search(content) is not None
+                if has_digits:
+                    candidates.append(entry)
+            elif any(anchor in folded for anchor in anchors):
+                candidates.append(entry)
+        if len(candidates) < len(self._compiled_patterns):
+            return candidates
+        
+        # Nothing ruled out: one pass over the combined pattern rejects clean
+        # content before running each pattern individually
+        if self._combined_pattern is not None and self._combined_pattern.search(content) is None:
+            return []
+        return candidates
+    
+    def add_custom_pattern(self, pattern: str, name: str, group: str = 'custom'):
+        """Add a custom pattern for detection"""
+        self.add_custom_patterns([{'pattern': pattern, 'name': name, 'group': group}])
+    
+    def add_custom_patterns(self, pattern_configs: List[Dict]):
+        """Add several custom patterns, recompiling once for the whole batch"""
+        for pattern_config in pattern_configs:
+            self.patterns.setdefault(pattern_config.get('group', 'custom'), []).append({
+                'pattern': pattern_config['pattern'],
+                'name': pattern_config['name'],
+                'custom': True
+            })
+        self._compile_patterns()
+    
+    def detect_sensitive_content(self, content: str, raw: Optional[bytes] = None) -> List[DetectedItem]:
+        """Detect sensitive content in the given text"""
+        detected_items = []
+        
+        # Only patterns the prefilter saw somewhere in the content are run
+        # individually, which keeps each one's own (possibly overlapping) matches
+        for group, name, regex, compiled, severity in self._candidate_patterns(content, raw):
+            for match in compiled.finditer(content):
+                start, end = match.span()
+                detected_items.append(DetectedItem(group, name, match.group(0), start, end, severity))
         
         return detected_items
     
-    def redact_content(self, content: str, detected_items: List[Dict]) -> str:
+    @staticmethod
+    def merge_overlapping(content: str, detected_items: List[DetectedItem]) -> List[DetectedItem]:
+        """Collapse overlapping hits into one item per span, keeping the
+        highest severity (the same text often matches several patterns)"""
+        merged = []
+        for item in sorted(detected_items, key=lambda x: (x.start, -x.end)):
+            if merged and item.start < merged[-1].end:
+                previous = merged[-1]
+                if _SEVERITY_RANK[item.severity] > _SEVERITY_RANK[previous.severity]:
+                    previous.type, previous.name, previous.severity = item.type, item.name, item.severity
+                if item.end > previous.end:
+                    previous.end = item.end
+                    previous.match = content[previous.start:previous.end]
+                continue
+            merged.append(replace(item))
+        return merged
+    
+    def redact_content(self, content: str, detected_items: List[DetectedItem]) -> str:
         """Redact sensitive content by replacing with placeholders"""
         if not self.enable_redaction:
             return content
         
-        # Sort by position (reverse order to maintain indices)
-        sorted_items = sorted(detected_items, key=lambda x: x['start'], reverse=True)
-        
-        redacted_content = content
-        for item in sorted_items:
-            # Replace with redaction placeholder
-            placeholder = f"[REDACTED_{item['type'].upper()}]"
-            redacted_content = (
-                redacted_content[:item['start']] + 
-                placeholder + 
-                redacted_content[item['end']:]
-            )
+        # Walk the items in position order and join the kept slices and
+        # placeholders once, instead of rebuilding the string per item
+        parts = []
+        cursor = 0
+        for item in sorted(detected_items, key=lambda x: (x.start, -x.end)):
+            if item.start < cursor:
+                # Overlaps the previous placeholder: hide whatever sticks out under it
+                cursor = max(cursor, item.end)
+                continue
+            parts.append(content[cursor:item.start])
+            parts.append(f"[REDACTED_{item.type.upper()}]")
+            cursor = item.end
+        parts.append(content[cursor:])
         
-        return redacted_content
+        return ''.join(parts)
     
-    def filter_content(self, content: str) -> Tuple[str, bool, List[Dict]]:
+    def filter_content(self, content: Union[str, bytes]) -> Tuple[str, bool, List[DetectedItem]]:
         """
         Filter content for sensitive information
         
+        content may be UTF-8 bytes (e.g. read straight from a file); it is
+        decoded once and the filtered result is always a str.
+        
         Returns:
             Tuple of (filtered_content, should_skip, detected_items)
         """
-        self.stats['total_processed'] += 1
+        raw = None
+        if isinstance(content, bytes):
+            raw = content
+            content = raw.decode('utf-8', errors='replace')
         
-        # Detect sensitive content
-        detected_items = self.detect_sensitive_content(content)
+        # Detect sensitive content, one item per distinct span
+        detected_items = self._detect_merged(content, raw)
         
         if not detected_items:
+            self._record_stats()
             return content, False, []
         
-        self.stats['sensitive_detected'] += 1
-        
         # Check if we should skip this content entirely
         should_skip = False
         if self.skip_sensitive:
             # Check for high-risk patterns
             for item in detected_items:
-                if item['severity'] == 'high':
+                if item.severity == 'high':
                     should_skip = True
-                    self.stats['skipped_items'] += 1
                     break
         
         if should_skip:
+            self._record_stats('sensitive_detected', 'skipped_items')
             return content, True, detected_items
         
         # Redact sensitive content
         if self.enable_redaction:
             filtered_content = self.redact_content(content, detected_items)
-            self.stats['redacted_items'] += 1
+            self._record_stats('sensitive_detected', 'redacted_items')
             return filtered_content, False, detected_items
         
         # Return original content if redaction is disabled
+        self._record_stats('sensitive_detected')
         return content, False, detected_items
     
+    def _record_stats(self, *counters: str):
+        """Count one processed item plus the given counters, as a single update"""
+        with self._stats_lock:
+            self.stats['total_processed'] += 1
+            for counter in counters:
+                self.stats[counter] += 1
+    
+    def _detect_merged(self, content: str, raw: Optional[bytes] = None) -> List[DetectedItem]:
+        """merge_overlapping(detect_sensitive_content(content)), memoized for
+        recently seen content since the same snippet is often copied repeatedly
+        
+        The content string itself is the key, so a hit is an exact match; each
+        caller gets its own copies of the cached items.
+        """
+        with self._detection_lock:
+            cache = self._detection_cache
+            items = cache.get(content)
+            if items is not None:
+                cache.move_to_end(content)
+        
+        if items is None:
+            items = self.merge_overlapping(content, self.detect_sensitive_content(content, raw))
+            with self._detection_lock:
+                # Skip storing into a cache that a pattern reload has replaced
+                if cache is self._detection_cache:
+                    cache[content] = items
+                    while len(cache) > self.DETECTION_CACHE_SIZE:
+                        cache.popitem(last=False)
+        
+        return [replace(item) for item in items]
+    
+    def filter_contents(self, contents: List[Union[str, bytes]]) -> List[Tuple[str, bool, List[DetectedItem]]]:
+        """Filter several pieces of content, returning one filter_content result per input
+        
+        Each input is scanned on its own: joining them into one buffer would let
+        patterns built on \s, ^ and $ match across the separators.
+        """
+        filter_content = self.filter_content
+        return [filter_content(content) for content in contents]
+    
     def get_statistics(self) -> Dict:
-        """Get security filter statistics"""
-        return self.stats.copy()
+        """Get security filter statistics (a copy the caller may modify)"""
+        with self._stats_lock:
+            return self.stats.copy()
     
     def reset_statistics(self):
         """Reset statistics counters"""
-        self.stats = {
-            'total_processed': 0,
-            'sensitive_detected': 0,
-            'redacted_items': 0,
-            'skipped_items': 0
-        }
\ No newline at end of file
+        with self._stats_lock:
+            self.stats = {
+                'total_processed': 0,
+                'sensitive_detected': 0,
+                'redacted_items': 0,
+                'skipped_items': 0
+            }
\ No newline at end of file
@@ -5,12 +5,21 @@ Tracks processing state, learning, and optimization
 """
 
 import json
+import os
 import time
+import atexit
+import threading
+from collections import Counter, defaultdict
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class ProcessingState(Enum):
     PENDING = "pending"
     PROCESSING = "processing"
@@ -18,8 +27,14 @@ class ProcessingState(Enum):
     FAILED = "failed"
     RETRYING = "retrying"
 
+# slots: no per-record __dict__, which dominates memory with thousands of records.
+# Declared by hand (dataclass(slots=True) needs Python 3.10), so fields can't
+# carry class-level defaults and every record is built with all of them
 @dataclass
 class ProcessingRecord:
+    __slots__ = ('id', 'content_type', 'strategy', 'state', 'timestamp', 'attempts',
+                 'success', 'error_message', 'processing_time', 'metadata')
+    
     id: str
     content_type: str
     strategy: str
@@ -27,54 +42,145 @@ class ProcessingRecord:
     timestamp: float
     attempts: int
     success: bool
-    error_message: Optional[str] = None
-    processing_time: Optional[float] = None
-    metadata: Optional[Dict] = None
+    error_message: Optional[str]
+    processing_time: Optional[float]
+    metadata: Optional[Dict]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict, built field by field (asdict deep-copies every value)"""
+        return {
+            'id': self.id,
+            'content_type': self.content_type,
+            'strategy': self.strategy,
+            'state': self.state.value,
+            'timestamp': self.timestamp,
+            'attempts': self.attempts,
+            'success': self.success,
+            'error_message': self.error_message,
+            'processing_time': self.processing_time,
+            'metadata': self.metadata
+        }
 
 class StateManager:
     """Manages processing state and learning"""
     
+    # Mutations are batched: the file is rewritten at most every FLUSH_INTERVAL
+    # seconds, after FLUSH_EVERY pending changes, or at interpreter exit
+    FLUSH_INTERVAL = 0.5
+    FLUSH_EVERY = 32
+    
     def __init__(self, state_file: str = "processing_state.json"):
         self.state_file = Path(state_file)
         self.records: Dict[str, ProcessingRecord] = {}
         self.learning_data: Dict[str, Any] = {}
+        self._dirty = False
+        self._pending_changes = 0
+        self._last_flush = time.monotonic()
+        self._flush_timer = None
+        self._save_lock = threading.RLock()
+        # Running totals behind get_processing_stats, kept in step with records
+        self._state_counts = Counter()
+        self._strategy_stats = defaultdict(lambda: {'total': 0, 'success': 0})
         self.load_state()
+        atexit.register(self.flush)
     
     def load_state(self):
         """Load state from file"""
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                    records_data = {}
-                    for k, v in data.get('records', {}).items():
-                        # Convert state string back to enum
-                        v['state'] = ProcessingState(v['state'])
-                        records_data[k] = ProcessingRecord(**v)
-                    self.records = records_data
-                    self.learning_data = data.get('learning', {})
+                raw = self.state_file.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                records_data = {}
+                for k, v in data.get('records', {}).items():
+                    # Convert state string back to enum
+                    v['state'] = ProcessingState(v['state'])
+                    records_data[k] = ProcessingRecord(**v)
+                self.records = records_data
+                self.learning_data = data.get('learning', {})
             except Exception as e:
                 print(f"Error loading state: {e}")
                 self.records = {}
                 self.learning_data = {}
+        
+        self._recount()
+    
+    def _recount(self):
+        """Rebuild the running totals from scratch"""
+        self._state_counts.clear()
+        self._strategy_stats.clear()
+        for record in self.records.values():
+            self._count(record, 1)
+    
+    def _count(self, record: ProcessingRecord, delta: int):
+        """Add (delta=1) or remove (delta=-1) a record from the running totals"""
+        self._state_counts[record.state] += delta
+        strategy_stats = self._strategy_stats[record.strategy]
+        strategy_stats['total'] += delta
+        if record.success:
+            strategy_stats['success'] += delta
+    
+    def _mark_dirty(self):
+        """Record a mutation and write it out once the batch is due"""
+        with self._save_lock:
+            self._dirty = True
+            self._pending_changes += 1
+            if (self._pending_changes >= self.FLUSH_EVERY or
+                    time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL):
+                self.save_state()
+            elif self._flush_timer is None:
+                # Make sure an idle tail of changes still reaches the file
+                self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def flush(self):
+        """Write pending changes, if any"""
+        with self._save_lock:
+            if self._dirty:
+                self.save_state()
     
     def save_state(self):
         """Save state to file"""
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty = False
+            self._pending_changes = 0
+            self._last_flush = time.monotonic()
+            self._write_state()
+    
+    def _write_state(self):
         try:
-            # Convert ProcessingState enum to string for JSON serialization
-            records_data = {}
-            for k, v in self.records.items():
-                record_dict = asdict(v)
-                record_dict['state'] = v.state.value  # Convert enum to string
-                records_data[k] = record_dict
+            # Serialize fully in memory, then write it with a single write()
+            # to a temp file that atomically replaces the old state; the file
+            # is machine-read, so it is not indented
+            records = dict(self.records)
+            if orjson is not None:
+                # orjson encodes the dataclasses and the state enum natively
+                payload = orjson.dumps({
+                    'records': records,
+                    'learning': self.learning_data,
+                    'timestamp': time.time()
+                })
+            else:
+                data = {
+                    'records': {k: v.to_dict() for k, v in records.items()},
+                    'learning': self.learning_data,
+                    'timestamp': time.time()
+                }
+                payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
             
-            data = {
-                'records': records_data,
-                'learning': self.learning_data,
-                'timestamp': time.time()
-            }
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            tmp_path = self.state_file.with_name(self.state_file.name + '.tmp')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self.state_file)
         except Exception as e:
             print(f"Error saving state: {e}")
     
@@ -87,21 +193,30 @@ class StateManager:
             state=ProcessingState.PROCESSING,
             timestamp=time.time(),
             attempts=1,
-            success=False
+            success=False,
+            error_message=None,
+            processing_time=None,
+            metadata=None
         )
+        previous = self.records.get(content_id)
+        if previous is not None:
+            self._count(previous, -1)
         self.records[content_id] = record
-        self.save_state()
+        self._count(record, 1)
+        self._mark_dirty()
         return record
     
     def complete_processing(self, content_id: str, success: bool, processing_time: float = None, error_message: str = None):
         """Complete processing for an item"""
         if content_id in self.records:
             record = self.records[content_id]
+            self._count(record, -1)
             record.state = ProcessingState.COMPLETED if success else ProcessingState.FAILED
             record.success = success
+            self._count(record, 1)
             record.processing_time = processing_time
             record.error_message = error_message
-            self.save_state()
+            self._mark_dirty()
             
             # Update learning data
             self._update_learning_data(record)
@@ -112,9 +227,11 @@ class StateManager:
             record = self.records[content_id]
             if record.attempts < 3:  # Max 3 attempts
                 record.attempts += 1
+                self._count(record, -1)
                 record.state = ProcessingState.RETRYING
+                self._count(record, 1)
                 record.timestamp = time.time()
-                self.save_state()
+                self._mark_dirty()
                 return True
         return False
     
@@ -124,21 +241,15 @@ class StateManager:
         if total == 0:
             return {'total': 0}
         
-        completed = sum(1 for r in self.records.values() if r.state == ProcessingState.COMPLETED)
-        failed = sum(1 for r in self.records.values() if r.state == ProcessingState.FAILED)
-        pending = sum(1 for r in self.records.values() if r.state == ProcessingState.PENDING)
+        # Maintained incrementally on every state change, so no pass over records
+        completed = self._state_counts[ProcessingState.COMPLETED]
+        failed = self._state_counts[ProcessingState.FAILED]
+        pending = self._state_counts[ProcessingState.PENDING]
         
         success_rate = (completed / total) * 100 if total > 0 else 0
         
         # Strategy performance
-        strategy_stats = {}
-        for record in self.records.values():
-            strategy = record.strategy
-            if strategy not in strategy_stats:
-                strategy_stats[strategy] = {'total': 0, 'success': 0}
-            strategy_stats[strategy]['total'] += 1
-            if record.success:
-                strategy_stats[strategy]['success'] += 1
+        strategy_stats = {strategy: dict(stats) for strategy, stats in self._strategy_stats.items() if stats['total']}
         
         return {
             'total': total,
@@ -198,16 +309,17 @@ class StateManager:
             total = strategy_data['total']
             strategy_data['avg_processing_time'] = ((current_avg * (total - 1)) + record.processing_time) / total
         
-        self.save_state()
+        self._mark_dirty()
     
     def cleanup_old_records(self, max_age_hours: int = 24):
         """Clean up old processing records"""
         cutoff_time = time.time() - (max_age_hours * 3600)
-        old_records = [k for k, v in self.records.items() if v.timestamp < cutoff_time]
-        
-        for record_id in old_records:
-            del self.records[record_id]
+        # Rebuild in one pass rather than deleting keys one at a time
+        kept = {k: v for k, v in self.records.items() if v.timestamp >= cutoff_time}
+        removed = len(self.records) - len(kept)
         
-        if old_records:
-            self.save_state()
-            print(f"Cleaned up {len(old_records)} old records")
+        if removed:
+            self.records = kept
+            self._recount()
+            self._mark_dirty()
+            print(f"Cleaned up {removed} old records")
@@ -7,6 +7,11 @@ import pyperclip
 import time
 import hashlib
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 print("Auto clipboard test starting...")
 print("Copy some text or images to test...")
 print("Press Ctrl+C to stop.")
@@ -18,8 +23,12 @@ try:
         content = pyperclip.paste()
         
         if content:
-            # Create hash for duplicate detection
-            content_hash = hashlib.md5(content.encode()).hexdigest()
+            # Create hash for duplicate detection (xxh3, or BLAKE2b without xxhash)
+            data = content.encode('utf-8', 'surrogatepass')
+            if xxhash is not None:
+                content_hash = xxhash.xxh3_128_hexdigest(data)
+            else:
+                content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
             
             if content_hash not in processed_items:
                 processed_items[content_hash] = time.time()
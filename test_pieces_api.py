@@ -5,6 +5,25 @@ Test Pieces API availability
 
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+def probe(session, endpoint):
+    """Request one endpoint and return the report lines for it"""
+    lines = [f"Testing: {endpoint}"]
+    try:
+        response = session.get(endpoint, timeout=5)
+        lines.append(f"  Status: {response.status_code}")
+        if response.status_code == 200:
+            lines.append(f"  Response: {response.text[:100]}...")
+        else:
+            lines.append(f"  Error: {response.text[:100]}...")
+    except requests.exceptions.ConnectionError:
+        lines.append(f"  Connection failed")
+    except requests.exceptions.Timeout:
+        lines.append(f"  Timeout")
+    except Exception as e:
+        lines.append(f"  Error: {e}")
+    return lines
 
 def test_api():
     print("Testing Pieces API availability...")
@@ -17,22 +36,12 @@ def test_api():
         "http://localhost:39300/api/applications"
     ]
     
-    for endpoint in endpoints:
-        try:
-            print(f"Testing: {endpoint}")
-            response = requests.get(endpoint, timeout=5)
-            print(f"  Status: {response.status_code}")
-            if response.status_code == 200:
-                print(f"  Response: {response.text[:100]}...")
-            else:
-                print(f"  Error: {response.text[:100]}...")
-        except requests.exceptions.ConnectionError:
-            print(f"  Connection failed")
-        except requests.exceptions.Timeout:
-            print(f"  Timeout")
-        except Exception as e:
-            print(f"  Error: {e}")
-        print()
+    # One keep-alive session for the shared host; the probes are independent,
+    # so run them concurrently and print the reports in endpoint order
+    with requests.Session() as session, ThreadPoolExecutor(len(endpoints)) as executor:
+        for lines in executor.map(lambda endpoint: probe(session, endpoint), endpoints):
+            print("\n".join(lines))
+            print()
 
 if __name__ == "__main__":
     test_api()
@@ -3,9 +3,94 @@
 Test script to check Pieces.app assets and see if images are imported as image assets or text snippets
 """
 
+import base64
+import calendar
 import requests
+from requests.adapters import HTTPAdapter
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _decode_json(response):
+    """Decode a JSON response body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _format_json(data):
+    """Pretty-print data as JSON (two-space indent), with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
+# JPEG and PNG file signatures, checked against the decoded head of a snippet
+_IMAGE_MAGIC = (b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n')
+
+def _is_base64_image(content):
+    """True if text content is base64 whose first bytes are a JPEG/PNG signature
+    
+    Only the first 16 base64 characters (12 bytes) are decoded; whitespace and
+    line breaks in or before them are ignored.
+    """
+    head = ''.join(content[:64].split())[:16]
+    head = head[:len(head) - len(head) % 4]
+    try:
+        return base64.b64decode(head).startswith(_IMAGE_MAGIC)
+    except ValueError:
+        return False
+
+# Shared keep-alive connections to the local Pieces daemon across calls
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Validators and body of the last /assets response; the list only grows, so
+# a conditional GET lets the daemon answer 304 with no body when unchanged
+_ASSETS_CACHE = {'etag': None, 'last_modified': None, 'assets': None}
+
+def _get_assets(assets_url):
+    """Fetch the asset list, reusing the cached copy on 304 Not Modified
+    
+    Returns (status_code, assets); assets is None unless the status is 200/304.
+    """
+    headers = {}
+    if _ASSETS_CACHE['assets'] is not None:
+        if _ASSETS_CACHE['etag']:
+            headers['If-None-Match'] = _ASSETS_CACHE['etag']
+        if _ASSETS_CACHE['last_modified']:
+            headers['If-Modified-Since'] = _ASSETS_CACHE['last_modified']
+    
+    response = _SESSION.get(assets_url, headers=headers, timeout=5)
+    if response.status_code == 304:
+        return 304, _ASSETS_CACHE['assets']
+    if response.status_code != 200:
+        return response.status_code, None
+    
+    assets = _decode_json(response)
+    _ASSETS_CACHE.update(etag=response.headers.get('ETag'),
+                         last_modified=response.headers.get('Last-Modified'),
+                         assets=assets)
+    return 200, assets
+
+def _iso_to_epoch(timestamp):
+    """Epoch seconds for an ISO 8601 timestamp
+    
+    UTC timestamps of the shape Pieces sends ("YYYY-MM-DDTHH:MM:SS[.fff]Z")
+    are sliced by offset; anything else (offsets, naive times) goes through
+    datetime.fromisoformat. Raises ValueError for malformed input.
+    """
+    if len(timestamp) >= 20 and timestamp[10] == 'T' and timestamp[-1] == 'Z' and timestamp[19] in '.Z':
+        seconds = calendar.timegm((int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                                   int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]), 0, 0, 0))
+        if timestamp[19] == '.':
+            seconds += float(timestamp[19:-1])
+        return seconds
+    if timestamp.endswith('Z'):
+        timestamp = timestamp[:-1] + '+00:00'
+    return datetime.fromisoformat(timestamp).timestamp()
 
 def check_pieces_assets():
     """Check recent assets in Pieces.app to see their types"""
@@ -14,51 +99,49 @@ def check_pieces_assets():
     try:
         # Try to get recent assets
         assets_url = f"{base_url}/assets"
-        response = requests.get(assets_url, timeout=5)
+        status_code, assets = _get_assets(assets_url)
         
-        if response.status_code == 200:
-            assets = response.json()
+        if assets is not None:
             print(f"Found {len(assets)} assets")
             
-            # Look for recent assets (last 10 minutes)
-            recent_time = datetime.now() - timedelta(minutes=10)
+            # Look for recent assets (last 10 minutes), compared as epoch
+            # seconds so aware and naive timestamps are handled alike
+            recent_epoch = (datetime.now(timezone.utc) - timedelta(minutes=10)).timestamp()
             
             for asset in assets:
                 # Check if asset was created recently
                 created_time = asset.get('created', '')
-                if created_time:
-                    try:
-                        # Parse timestamp if it's in ISO format
-                        if 'T' in created_time:
-                            asset_time = datetime.fromisoformat(created_time.replace('Z', '+00:00'))
+                # Only ISO timestamps are parsed
+                if not created_time or 'T' not in created_time:
+                    continue
+                try:
+                    asset_epoch = _iso_to_epoch(created_time)
+                except ValueError as e:
+                    print(f"  Error parsing time: {e}")
+                    continue
+                
+                if asset_epoch > recent_epoch:
+                    print(f"\nRecent Asset:")
+                    print(f"  ID: {asset.get('id', 'N/A')}")
+                    print(f"  Name: {asset.get('name', 'N/A')}")
+                    print(f"  Type: {asset.get('type', 'N/A')}")
+                    print(f"  Format: {asset.get('format', 'N/A')}")
+                    print(f"  Created: {created_time}")
+                    
+                    # Check if it's a text snippet with base64 content
+                    if asset.get('type') == 'text' or asset.get('format') == 'text':
+                        content = asset.get('content') or ''
+                        if isinstance(content, str) and _is_base64_image(content):
+                            print(f"  ⚠️  TEXT SNIPPET with base64 image content")
                         else:
-                            continue
-                        
-                        if asset_time > recent_time:
-                            print(f"\nRecent Asset:")
-                            print(f"  ID: {asset.get('id', 'N/A')}")
-                            print(f"  Name: {asset.get('name', 'N/A')}")
-                            print(f"  Type: {asset.get('type', 'N/A')}")
-                            print(f"  Format: {asset.get('format', 'N/A')}")
-                            print(f"  Created: {created_time}")
-                            
-                            # Check if it's a text snippet with base64 content
-                            if asset.get('type') == 'text' or asset.get('format') == 'text':
-                                content = asset.get('content', '')
-                                if content.startswith('/9j/') or content.startswith('iVBORw0KGgo'):
-                                    print(f"  ⚠️  TEXT SNIPPET with base64 image content")
-                                else:
-                                    print(f"  ✅ Text content (not base64)")
-                            elif asset.get('type') == 'image' or asset.get('format') == 'image':
-                                print(f"  ✅ IMAGE ASSET")
-                            else:
-                                print(f"  ❓ Unknown type")
-                                
-                    except Exception as e:
-                        print(f"  Error parsing time: {e}")
+                            print(f"  ✅ Text content (not base64)")
+                    elif asset.get('type') == 'image' or asset.get('format') == 'image':
+                        print(f"  ✅ IMAGE ASSET")
+                    else:
+                        print(f"  ❓ Unknown type")
                         
         else:
-            print(f"Failed to get assets: {response.status_code}")
+            print(f"Failed to get assets: {status_code}")
             
     except Exception as e:
         print(f"Error connecting to Pieces.app: {e}")
@@ -66,10 +149,10 @@ def check_pieces_assets():
         # Try alternative endpoint
         try:
             search_url = f"{base_url}/assets/search"
-            response = requests.get(search_url, params={"query": "clipboard"}, timeout=5)
+            response = _SESSION.get(search_url, params={"query": "clipboard"}, timeout=5)
             if response.status_code == 200:
-                results = response.json()
-                print(f"Search results: {json.dumps(results, indent=2)}")
+                results = _decode_json(response)
+                print(f"Search results: {_format_json(results)}")
         except Exception as e2:
             print(f"Search also failed: {e2}")
 
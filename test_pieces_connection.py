@@ -4,7 +4,6 @@ Test Pieces connection and basic functionality
 """
 
 import sys
-import traceback
 
 def test_pieces_connection():
     print("Testing Pieces.app connection...")
@@ -39,6 +38,7 @@ def test_pieces_connection():
     except Exception as e:
         print(f"- Connection error: {e}")
         print("Full traceback:")
+        import traceback
         traceback.print_exc()
         return False
 
@@ -7,19 +7,36 @@ import pyperclip
 import base64
 import tempfile
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-# Pieces OS imports
-from pieces_os_client.wrapper import PiecesClient
-from pieces_os_client.models.classification_specific_enum import ClassificationSpecificEnum
-from pieces_os_client.models.fragment_metadata import FragmentMetadata
+# 1x1 pixel PNG used by the image test, and its base64 form for the fallback
+_TEST_PNG_B64 = 'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=='
+_TEST_PNG_BYTES = base64.b64decode(_TEST_PNG_B64)
+
+# One client (and connection) shared by every test in this process
+_client = None
+_client_lock = threading.Lock()
+
+def _get_client():
+    global _client
+    with _client_lock:
+        if _client is None:
+            from pieces_os_client.wrapper import PiecesClient
+            _client = PiecesClient()
+    return _client
 
 def test_text_import():
     print("Testing text import...")
     
     try:
-        client = PiecesClient()
+        # Pieces SDK imports are deferred until a test actually runs
+        from pieces_os_client.models.classification_specific_enum import ClassificationSpecificEnum
+        from pieces_os_client.models.fragment_metadata import FragmentMetadata
+        
+        client = _get_client()
         print("+ Connected to Pieces.app")
         
         # Test text content
@@ -43,15 +60,15 @@ def test_image_import():
     print("Testing image import...")
     
     try:
-        client = PiecesClient()
-        print("+ Connected to Pieces.app")
+        from pieces_os_client.models.classification_specific_enum import ClassificationSpecificEnum
+        from pieces_os_client.models.fragment_metadata import FragmentMetadata
         
-        # Create a simple test image (1x1 pixel PNG)
-        test_image_data = base64.b64decode('iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg==')
+        client = _get_client()
+        print("+ Connected to Pieces.app")
         
-        # Save to temp file
+        # Save the test image (1x1 pixel PNG) to a temp file
         with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-            tmp_file.write(test_image_data)
+            tmp_file.write(_TEST_PNG_BYTES)
             temp_path = tmp_file.name
         
         print(f"+ Created test image: {temp_path}")
@@ -73,8 +90,7 @@ def test_image_import():
             
             # Try base64 method
             try:
-                base64_data = base64.b64encode(test_image_data).decode('utf-8')
-                asset_id = client.create_asset(base64_data, metadata)
+                asset_id = client.create_asset(_TEST_PNG_B64, metadata)
                 print(f"+ SUCCESS: Image imported via base64 with ID: {asset_id}")
                 return True
                 
@@ -93,12 +109,13 @@ def test_image_import():
 def main():
     print("=== Pieces Import Test ===")
     
-    # Test text import
-    text_ok = test_text_import()
-    print()
-    
-    # Test image import
-    image_ok = test_image_import()
+    # The two imports are independent round trips to Pieces, so run them
+    # side by side (their progress lines may interleave)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        text_future = executor.submit(test_text_import)
+        image_future = executor.submit(test_image_import)
+        text_ok = text_future.result()
+        image_ok = image_future.result()
     print()
     
     print("=== Test Results ===")
@@ -60,11 +60,13 @@ def test_security_filter():
     
     filter_with_redaction = SecurityFilter(enable_redaction=True, skip_sensitive=False)
     
-    for i, test_case in enumerate(test_cases, 1):
+    results = filter_with_redaction.filter_contents([test_case['content'] for test_case in test_cases])
+    
+    for i, (test_case, result) in enumerate(zip(test_cases, results), 1):
         print(f"\n{i}. Testing: {test_case['name']}")
         print(f"Original content:\n{test_case['content']}")
         
-        filtered_content, should_skip, detected_items = filter_with_redaction.filter_content(test_case['content'])
+        filtered_content, should_skip, detected_items = result
         
         has_sensitive = len(detected_items) > 0
         
@@ -3,14 +3,15 @@
 Test simple Pieces import
 """
 
-from pieces_os_client.wrapper import PiecesClient
-from pieces_os_client.models.classification_specific_enum import ClassificationSpecificEnum
-from pieces_os_client.models.fragment_metadata import FragmentMetadata
-
 def main():
     print("Testing simple Pieces import...")
     
     try:
+        # Imported here so loading this module doesn't pull in the Pieces SDK
+        from pieces_os_client.wrapper import PiecesClient
+        from pieces_os_client.models.classification_specific_enum import ClassificationSpecificEnum
+        from pieces_os_client.models.fragment_metadata import FragmentMetadata
+        
         client = PiecesClient()
         print("+ Connected to Pieces.app")
         
@@ -13,14 +13,27 @@ import shutil
 import logging
 import hashlib
 import sys
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-import pyperclip
-from PIL import Image
+import PIL
+from PIL import Image, BmpImagePlugin, features
 import io
 import win32clipboard
 import win32con
 
+# The clipboard change listener is shared with the services in src/
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+from clipboard_detector import ClipboardChangeListener
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,7 +44,36 @@ logging.basicConfig(
     ]
 )
 
+# Matches a 100-character run of the base64 alphabet (used to sniff unprefixed images)
+_B64_RE = re.compile(r'[A-Za-z0-9+/=]{100}')
+
+# Windows bitmap clipboard format, looked up once
+CF_DIB = win32con.CF_DIB
+
+# BITMAPINFOHEADER sizes that can start a CF_DIB payload
+_DIB_HEADER_SIZES = (12, 40, 52, 56, 64, 108, 124)
+
+def _is_valid_image_header(data):
+    """Cheap magic-byte check for the image formats the clipboard carries"""
+    return (data[:8] == b'\x89PNG\r\n\x1a\n'            # PNG
+            or data[:3] == b'\xff\xd8\xff'                 # JPEG
+            or data[:2] == b'BM'                            # BMP
+            or data[:6] in (b'GIF87a', b'GIF89a')           # GIF
+            or (data[:4] == b'RIFF' and data[8:12] == b'WEBP')
+            or int.from_bytes(data[:4], 'little') in _DIB_HEADER_SIZES)  # DIB
+
 class WorkingClipboardService:
+    # Lowest JPEG quality compress_image will go to for the size limit
+    MIN_JPEG_QUALITY = 30
+    
+    # A clipboard read that fails while waiting on change notifications is
+    # retried this many times, backing off by this many seconds per attempt
+    CLIPBOARD_READ_RETRIES = 5
+    CLIPBOARD_RETRY_DELAY = 0.1
+    
+    # Text is UTF-8 encoded for hashing one slice of this many characters at a time
+    HASH_CHUNK_CHARS = 1 << 20
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
@@ -47,9 +89,24 @@ class WorkingClipboardService:
         self.pieces_dir = Path.home() / ".pieces"
         self.pieces_dir.mkdir(exist_ok=True)
         
-        # Track processed clipboard items with timestamps
-        self.processed_items = {}
+        # Track processed clipboard items with timestamps, least recently seen first
+        self.processed_items = OrderedDict()
         self.max_cache_size = 100
+        self._lock = threading.Lock()
+        
+        # Clipboard sequence number of the last content read
+        self._clipboard_seq = None
+        self._read_retries = 0
+        
+        # Images are compressed and uploaded here, so the next capture is
+        # encoded while the previous one is still being posted
+        self._upload_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pieces-upload")
+        self._in_flight = set()
+        
+        # Text backups are written here while the upload runs on the
+        # calling thread; separate from the upload pool so a backup never
+        # queues behind image work
+        self._backup_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pieces-backup")
         
         # Image compression settings
         self.max_image_size = 500000  # 500KB limit
@@ -58,42 +115,110 @@ class WorkingClipboardService:
         self.logger.info("Working Clipboard Monitoring Service Initialized")
         self.logger.info(f"Files will be saved to: {self.pieces_dir}")
         self.logger.info(f"Max image size: {self.max_image_size} bytes")
+        # Pillow-SIMD (versioned X.Y.Z.postN) vectorizes the resize, and
+        # libjpeg-turbo the JPEG encode; both dominate compress_image
+        self.logger.info(f"Pillow {PIL.__version__}: SIMD build {'yes' if '.post' in PIL.__version__ else 'no'}, "
+                         f"libjpeg-turbo {'yes' if features.check_feature('libjpeg_turbo') else 'no'}")
+    
+    def _start_clipboard_listener(self):
+        """Start listening for clipboard change notifications
+        
+        self._clipboard_changed is set on every WM_CLIPBOARDUPDATE for
+        run_service. Returns True if the listener is running.
+        """
+        self._clipboard_listener = ClipboardChangeListener("WorkingClipboardListener")
+        self._clipboard_changed = self._clipboard_listener.changed
+        if self._clipboard_listener.start():
+            return True
+        self._clipboard_listener = None
+        return False
+    
+    def _stop_clipboard_listener(self):
+        """Close the listener window, ending its message pump"""
+        listener = getattr(self, '_clipboard_listener', None)
+        if listener is not None:
+            listener.stop()
+            self._clipboard_listener = None
+    
+    def _retry_clipboard_read(self):
+        """Schedule another read after a failed one
+        
+        When polling, the next poll retries. With change notifications there
+        is no next pass until the clipboard changes again, so the listener's
+        event is re-armed after a short, growing delay, up to
+        CLIPBOARD_READ_RETRIES times.
+        """
+        listener = getattr(self, '_clipboard_listener', None)
+        if listener is None:
+            return
+        if self._read_retries >= self.CLIPBOARD_READ_RETRIES:
+            self.logger.warning("Clipboard stayed busy, giving up on the current content")
+            self._read_retries = 0
+            return
+        self._read_retries += 1
+        listener.signal_later(self.CLIPBOARD_RETRY_DELAY * self._read_retries)
+    
+    def _read_clipboard(self):
+        """Read the clipboard in one OpenClipboard/CloseClipboard cycle
+        
+        Returns (format, data): CF_DIB bytes if an image is present, otherwise
+        the CF_UNICODETEXT text, or (None, None). Availability is checked
+        before opening, so nothing is opened when neither format is present.
+        """
+        for clipboard_format in (CF_DIB, win32con.CF_UNICODETEXT):
+            if win32clipboard.IsClipboardFormatAvailable(clipboard_format):
+                break
+        else:
+            return None, None
+        
+        win32clipboard.OpenClipboard()
+        try:
+            return clipboard_format, win32clipboard.GetClipboardData(clipboard_format)
+        finally:
+            win32clipboard.CloseClipboard()
     
     def detect_clipboard_content_type(self):
         """Detect if clipboard contains text or image data"""
         try:
-            # First try to get image data from Windows clipboard
+            # Windows bumps the sequence number on every clipboard change, so an
+            # unchanged number means there is nothing new to read or hash
             try:
-                win32clipboard.OpenClipboard()
-                if win32clipboard.IsClipboardFormatAvailable(win32con.CF_DIB):
-                    # Get image data from clipboard
-                    image_data = win32clipboard.GetClipboardData(win32con.CF_DIB)
-                    win32clipboard.CloseClipboard()
-                    
-                    if image_data:
-                        self.logger.debug("Detected Windows clipboard image data")
-                        return "image", image_data
+                seq = win32clipboard.GetClipboardSequenceNumber()
+            except Exception:
+                seq = None
+            if seq is not None and seq == self._clipboard_seq:
+                return None, None
+            
+            # Read image or text in a single clipboard session
+            try:
+                clipboard_format, clipboard_content = self._read_clipboard()
             except Exception as e:
+                # Leave the sequence number alone so a busy clipboard is retried
                 self.logger.debug(f"Windows clipboard check failed: {e}")
-            finally:
-                try:
-                    win32clipboard.CloseClipboard()
-                except:
-                    pass
+                self._retry_clipboard_read()
+                return None, None
             
-            # Fallback to pyperclip for text and base64 images
-            clipboard_content = pyperclip.paste()
+            # Remember which clipboard generation this content belongs to
+            self._clipboard_seq = seq
+            self._read_retries = 0
+            
+            if clipboard_format == CF_DIB:
+                if clipboard_content:
+                    self.logger.debug("Detected Windows clipboard image data")
+                    return "image", clipboard_content
+                return None, None
             
             if not clipboard_content:
                 return None, None
             
             # Check if it's image data (base64)
             if isinstance(clipboard_content, str):
-                # Check for common image base64 patterns
-                if (clipboard_content.startswith('iVBORw0KGgo') or  # PNG
-                    clipboard_content.startswith('/9j/') or          # JPEG
-                    clipboard_content.startswith('data:image/') or  # Data URL
-                    len(clipboard_content) > 1000 and all(c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=' for c in clipboard_content[:100])):
+                # Check for common image base64 patterns; for unprefixed base64,
+                # isascii() reads the string's stored kind flag (O(1)), so text
+                # with any non-ASCII character skips the regex
+                if (clipboard_content.startswith(('iVBORw0KGgo', '/9j/', 'data:image/')) or  # PNG, JPEG, data URL
+                    len(clipboard_content) > 1000 and clipboard_content.isascii()
+                        and _B64_RE.match(clipboard_content, 0, 100) is not None):
                     self.logger.debug("Detected base64 image data")
                     return "image", clipboard_content
             
@@ -108,83 +233,102 @@ class WorkingClipboardService:
             self.logger.debug(f"Error checking clipboard: {e}")
             return None, None
     
-    def compress_image(self, image_path):
-        """Compress image to reduce size for upload"""
+    def compress_image(self, image_bytes, is_dib=False):
+        """Compress in-memory image bytes to JPEG bytes (None on failure)
+        
+        is_dib marks Windows CF_DIB data, a headerless bitmap that is decoded
+        with the DIB plugin directly instead of probing every image format.
+        """
+        image_opener = BmpImagePlugin.DibImageFile if is_dib else Image.open
         try:
-            with Image.open(image_path) as img:
+            with image_opener(io.BytesIO(image_bytes)) as img:
+                # A JPEG already within the size and dimension limits (only the
+                # header has been read so far) is used as is
+                if (img.format == 'JPEG' and len(image_bytes) <= self.max_image_size
+                        and img.size[0] <= self.max_dimensions[0]
+                        and img.size[1] <= self.max_dimensions[1]):
+                    self.logger.info(f"Image already within limits: {len(image_bytes)} bytes, not recompressing")
+                    return image_bytes
+                
+                # Large JPEGs: let libjpeg decode at 1/2, 1/4 or 1/8 scale
+                # (never below max_dimensions), leaving thumbnail less to do
+                if (img.format == 'JPEG' and (img.size[0] > self.max_dimensions[0]
+                                              or img.size[1] > self.max_dimensions[1])):
+                    img.draft('RGB', self.max_dimensions)
+                
                 # Convert to RGB if necessary
                 if img.mode in ('RGBA', 'LA', 'P'):
                     img = img.convert('RGB')
                 
                 # Resize if too large
                 if img.size[0] > self.max_dimensions[0] or img.size[1] > self.max_dimensions[1]:
-                    img.thumbnail(self.max_dimensions, Image.Resampling.LANCZOS)
+                    # BICUBIC is indistinguishable from LANCZOS after JPEG for mild
+                    # downscales and much cheaper; keep LANCZOS for 2x and beyond
+                    ratio = max(img.size[0] / self.max_dimensions[0], img.size[1] / self.max_dimensions[1])
+                    resample = Image.Resampling.BICUBIC if ratio < 2.0 else Image.Resampling.LANCZOS
+                    img.thumbnail(self.max_dimensions, resample)
                     self.logger.info(f"Resized image to {img.size}")
                 
-                # Save compressed version
-                compressed_path = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-                
-                # Try different quality levels to get under size limit
-                for quality in [90, 85, 70, 50]:
-                    img.save(compressed_path.name, 'JPEG', quality=quality, optimize=True)
+                # Encode in memory at quality 90; if that is over the size limit,
+                # estimate the quality that fits from how far over it was
+                # (size falls roughly with the square of quality; aim 10% low)
+                # instead of stepping down one level at a time
+                buffer = io.BytesIO()
+                quality = 90
+                for attempt in range(4):
+                    buffer.seek(0)
+                    buffer.truncate()
+                    img.save(buffer, 'JPEG', quality=quality, optimize=True)
                     
-                    # Check file size
-                    file_size = os.path.getsize(compressed_path.name)
+                    # Check encoded size
+                    file_size = buffer.tell()
                     self.logger.info(f"Compressed image: {file_size} bytes (quality: {quality})")
                     
-                    if file_size <= self.max_image_size:
+                    if file_size <= self.max_image_size or quality <= self.MIN_JPEG_QUALITY:
                         break
+                    estimate = int(quality * (0.9 * self.max_image_size / file_size) ** 0.5)
+                    quality = max(self.MIN_JPEG_QUALITY, min(quality - 5, estimate))
                 
-                return compressed_path.name
+                return buffer.getvalue()
                 
         except Exception as e:
             self.logger.error(f"Error compressing image: {e}")
             return None
     
-    def save_image_to_file(self, image_data):
-        """Save clipboard image data to temporary file"""
+    def load_image_bytes(self, image_data):
+        """Decode clipboard image data to bytes in memory (no temporary file)"""
         try:
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-            temp_path = Path(temp_file.name)
-            
-            # Handle different image data formats
+            # Windows clipboard image data is used as is; base64 (optionally
+            # a data URL) is decoded once after stripping the prefix
             if isinstance(image_data, bytes):
-                # Windows clipboard image data
-                temp_file.write(image_data)
-            elif image_data.startswith('data:image/'):
-                # Data URL format
-                base64_data = image_data.split(',')[1]
-                image_bytes = base64.b64decode(base64_data)
-                temp_file.write(image_bytes)
-            elif image_data.startswith('iVBORw0KGgo'):
-                # PNG base64
-                image_bytes = base64.b64decode(image_data)
-                temp_file.write(image_bytes)
+                image_bytes = image_data
+            elif image_data.startswith('data:'):
+                image_bytes = base64.b64decode(image_data.split(',', 1)[1])
             else:
-                # Assume base64
                 image_bytes = base64.b64decode(image_data)
-                temp_file.write(image_bytes)
             
-            temp_file.close()
+            # CF_DIB data is an image by definition, and a recognised header is
+            # enough for the rest; unknown payloads only need Pillow to
+            # identify a format (a header read), since compress_image decodes
+            # the image in full anyway and fails on corrupt data
+            if isinstance(image_data, bytes) or _is_valid_image_header(image_bytes[:12]):
+                return image_bytes
             
-            # Verify it's a valid image
             try:
-                with Image.open(temp_path) as img:
-                    img.verify()
-                self.logger.info(f"Saved valid image: {temp_path}")
-                return temp_path
+                Image.open(io.BytesIO(image_bytes)).close()
+                return image_bytes
             except Exception:
-                os.unlink(temp_path)
                 self.logger.warning("Invalid image data in clipboard")
                 return None
                 
         except Exception as e:
-            self.logger.error(f"Error saving clipboard image: {e}")
+            self.logger.error(f"Error decoding clipboard image: {e}")
             return None
     
     def create_filename(self, content_type):
         """Create a unique filename based on content type"""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        # time.strftime formats the current local time without building a datetime
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
         if content_type == "image":
             return f"Screenshot_{timestamp}.jpg"  # Use JPG for compressed images
         else:
@@ -224,11 +368,16 @@ class WorkingClipboardService:
             # Create the file in .pieces directory
             file_path = self.pieces_dir / filename
             
+            # Everything is written to a sibling .tmp file and renamed into
+            # place, so Pieces.app auto-import never sees a partial file
+            tmp_path = file_path.with_name(file_path.name + ".tmp")
             if content_type == "text":
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content_or_path)
+                tmp_path.write_text(content_or_path, encoding="utf-8")
+            elif isinstance(content_or_path, bytes):
+                tmp_path.write_bytes(content_or_path)
             else:
-                shutil.copy2(content_or_path, file_path)
+                shutil.copyfile(content_or_path, tmp_path)
+            os.replace(tmp_path, file_path)
             
             # Create metadata file
             metadata_path = self.pieces_dir / f"{filename}.pieces.json"
@@ -239,8 +388,9 @@ class WorkingClipboardService:
                 "source": "clipboard_monitor"
             }
             
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
+            tmp_path = metadata_path.with_name(metadata_path.name + ".tmp")
+            tmp_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+            os.replace(tmp_path, metadata_path)
             
             self.logger.info(f"Saved backup files to: {self.pieces_dir}")
             return True
@@ -253,23 +403,23 @@ class WorkingClipboardService:
         """Process clipboard item based on its type"""
         try:
             # Create unique identifier for this clipboard item
-            if isinstance(content, bytes):
-                item_hash = hashlib.md5(content).hexdigest()
-            else:
-                item_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
+            item_hash = self._item_hash(content)
             
-            current_time = datetime.now()
+            # Monotonic seconds: cheap to compare and immune to clock changes
+            current_time = time.monotonic()
             
             # Check if we've processed this exact item recently (within last 30 seconds)
-            if item_hash in self.processed_items:
-                last_processed = self.processed_items[item_hash]
-                time_diff = (current_time - last_processed).total_seconds()
-                
-                if time_diff < 30:  # 30 seconds
-                    self.logger.debug(f"Item processed {time_diff:.1f}s ago, skipping duplicate")
-                    return None  # Return None to indicate no processing was done
-                else:
-                    self.logger.debug(f"Item processed {time_diff:.1f}s ago, processing again")
+            with self._lock:
+                if item_hash in self.processed_items:
+                    last_processed = self.processed_items[item_hash]
+                    time_diff = current_time - last_processed
+                    self.processed_items.move_to_end(item_hash)
+                    
+                    if time_diff < 30:  # 30 seconds
+                        self.logger.debug(f"Item processed {time_diff:.1f}s ago, skipping duplicate")
+                        return None  # Return None to indicate no processing was done
+                    else:
+                        self.logger.debug(f"Item processed {time_diff:.1f}s ago, processing again")
             
             self.logger.info(f"Processing new {content_type} content...")
             
@@ -277,63 +427,36 @@ class WorkingClipboardService:
             filename = self.create_filename(content_type)
             
             if content_type == "text":
-                # Upload text content directly to Pieces.app
+                # Write the backup while the text is uploaded directly to
+                # Pieces.app; the two share nothing once the content is known
+                backup = self._backup_pool.submit(self.save_to_pieces_dir, content, filename, content_type)
                 asset_id = self.upload_to_pieces(content, content_type)
-                
-                # Also save as backup
-                save_success = self.save_to_pieces_dir(content, filename, content_type)
+                save_success = backup.result()
                 
             elif content_type == "image":
-                # Save image to temporary file
-                temp_image_path = self.save_image_to_file(content)
-                if not temp_image_path:
-                    self.logger.warning("Failed to save clipboard image")
+                # Decode the image in memory; only the compressed JPEG touches disk
+                image_bytes = self.load_image_bytes(content)
+                if not image_bytes:
+                    self.logger.warning("Failed to read clipboard image")
                     return False
                 
-                try:
-                    # Compress the image
-                    compressed_path = self.compress_image(temp_image_path)
-                    if not compressed_path:
-                        self.logger.error("Failed to compress image")
-                        return False
-                    
-                    # Upload compressed image directly to Pieces.app
-                    asset_id = self.upload_to_pieces(compressed_path, content_type)
-                    
-                    # Also save as backup
-                    save_success = self.save_to_pieces_dir(compressed_path, filename, content_type)
-                    
-                finally:
-                    # Clean up temporary files
-                    try:
-                        os.unlink(temp_image_path)
-                    except:
-                        pass
-                    try:
-                        if compressed_path:
-                            os.unlink(compressed_path)
-                    except:
-                        pass
+                # Claim the item now so later polls skip it while it is in flight;
+                # the claim is dropped again if compression or upload fails
+                self._mark_processed(item_hash, current_time)
+                future = self._upload_pool.submit(self._process_image, image_bytes, filename,
+                                                  isinstance(content, bytes))
+                self._in_flight.add(future)
+                future.add_done_callback(lambda f, h=item_hash: self._image_done(f, h))
+                self.logger.info("Image queued for compression and upload")
+                return True
             else:
                 self.logger.warning(f"Unknown content type: {content_type}")
                 return False
             
             # Mark as processed if upload or save was successful
             if asset_id or save_success:
-                self.processed_items[item_hash] = current_time
-                
-                if asset_id:
-                    self.logger.info(f"SUCCESS: {content_type.title()} content uploaded to Pieces.app")
-                    self.logger.info(f"Asset ID: {asset_id}")
-                if save_success:
-                    self.logger.info(f"SUCCESS: {content_type.title()} content saved as backup")
-                
-                # Clean up old entries to prevent memory growth
-                if len(self.processed_items) > self.max_cache_size:
-                    sorted_items = sorted(self.processed_items.items(), key=lambda x: x[1])
-                    for key, _ in sorted_items[:len(sorted_items) - self.max_cache_size]:
-                        del self.processed_items[key]
-                
+                self._mark_processed(item_hash, current_time)
+                self._log_success(content_type, asset_id, save_success)
                 return True
             else:
                 self.logger.error(f"FAILED: {content_type.title()} content upload/save failed")
@@ -343,13 +466,113 @@ class WorkingClipboardService:
             self.logger.error(f"Error processing {content_type} content: {e}")
             return False
     
+    def _item_hash(self, content):
+        """Hash clipboard content (str or bytes) to an int key for processed_items
+        
+        Fast non-cryptographic hash; BLAKE2b when xxhash is not installed.
+        The key only lives in processed_items, so a 64-bit int is enough and
+        saves building a hex string per item.
+        """
+        hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=8)
+        
+        if isinstance(content, str):
+            # Large text (base64 images) is encoded and hashed in slices rather
+            # than as one full-size UTF-8 copy; UTF-8 is concatenative, so the
+            # digest matches a one-shot encode
+            for start in range(0, len(content), self.HASH_CHUNK_CHARS):
+                hasher.update(content[start:start + self.HASH_CHUNK_CHARS].encode('utf-8', 'surrogatepass'))
+        else:
+            # CF_DIB bytes are hashed in place, without a copy
+            hasher.update(memoryview(content))
+        
+        if xxhash is not None:
+            return hasher.intdigest()
+        return int.from_bytes(hasher.digest(), 'little')
+    
+    def _mark_processed(self, item_hash, current_time):
+        """Record an item as processed, evicting the least recently seen entries"""
+        with self._lock:
+            self.processed_items[item_hash] = current_time
+            self.processed_items.move_to_end(item_hash)
+            
+            # Clean up old entries to prevent memory growth
+            while len(self.processed_items) > self.max_cache_size:
+                self.processed_items.popitem(last=False)
+    
+    def _log_success(self, content_type, asset_id, save_success):
+        if asset_id:
+            self.logger.info(f"SUCCESS: {content_type.title()} content uploaded to Pieces.app")
+            self.logger.info(f"Asset ID: {asset_id}")
+        if save_success:
+            self.logger.info(f"SUCCESS: {content_type.title()} content saved as backup")
+    
+    def _process_image(self, image_bytes, filename, is_dib=False):
+        """Compress, upload and back up a clipboard image (runs on the upload pool)"""
+        # Compress the image in memory
+        jpeg_bytes = self.compress_image(image_bytes, is_dib)
+        if not jpeg_bytes:
+            self.logger.error("Failed to compress image")
+            return None, False
+        
+        # The JPEG is written to disk once, as the .pieces backup, and that
+        # file is what gets uploaded to Pieces.app
+        if self.save_to_pieces_dir(jpeg_bytes, filename, "image"):
+            return self.upload_to_pieces(str(self.pieces_dir / filename), "image"), True
+        
+        # No backup file to upload from: use a temporary JPEG instead
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as temp_file:
+                temp_file.write(jpeg_bytes)
+                temp_path = temp_file.name
+            return self.upload_to_pieces(temp_path, "image"), False
+        finally:
+            try:
+                if temp_path:
+                    os.unlink(temp_path)
+            except:
+                pass
+    
+    def _image_done(self, future, item_hash):
+        """Log a finished image upload and release its claim if it failed"""
+        self._in_flight.discard(future)
+        try:
+            asset_id, save_success = future.result()
+        except Exception as e:
+            self.logger.error(f"Error processing image content: {e}")
+            asset_id, save_success = None, False
+        
+        if asset_id or save_success:
+            self._log_success("image", asset_id, save_success)
+            self.logger.info("Image content successfully saved!")
+        else:
+            self.logger.error("FAILED: Image content upload/save failed")
+            with self._lock:
+                self.processed_items.pop(item_hash, None)
+    
     def run_service(self, check_interval=2):
-        """Run the clipboard monitoring service"""
-        self.logger.info(f"Starting working clipboard monitoring service (checking every {check_interval} seconds)")
+        """Run the clipboard monitoring service
+        
+        The clipboard is read when Windows reports a change; polling every
+        check_interval seconds is only used if the listener cannot be started.
+        """
+        use_notifications = self._start_clipboard_listener()
+        if use_notifications:
+            self.logger.info("Starting working clipboard monitoring service (clipboard change notifications)")
+            # Check whatever is on the clipboard at startup once
+            self._clipboard_changed.set()
+        else:
+            self.logger.info(f"Starting working clipboard monitoring service (checking every {check_interval} seconds)")
         
         try:
             while True:
                 try:
+                    if use_notifications:
+                        # Short timeout keeps Ctrl+C responsive on Windows
+                        if not self._clipboard_changed.wait(timeout=1):
+                            continue
+                        self._clipboard_changed.clear()
+                    
                     # Check clipboard content type
                     content_type, content = self.detect_clipboard_content_type()
                     
@@ -367,7 +590,8 @@ class WorkingClipboardService:
                                 self.logger.warning(f"{content_type.title()} content save failed")
                     
                     # Wait before next check
-                    time.sleep(check_interval)
+                    if not use_notifications:
+                        time.sleep(check_interval)
                     
                 except KeyboardInterrupt:
                     self.logger.info("Service stopped by user")
@@ -379,6 +603,12 @@ class WorkingClipboardService:
         except KeyboardInterrupt:
             self.logger.info("Service stopped")
         finally:
+            self._stop_clipboard_listener()
+            # Let queued image uploads finish before exiting
+            if self._in_flight:
+                self.logger.info(f"Waiting for {len(self._in_flight)} image upload(s) to finish")
+            self._upload_pool.shutdown(wait=True)
+            self._backup_pool.shutdown(wait=True)
             self.logger.info("Service shutdown complete")
 
 def main():